@@ -38,11 +38,11 @@ from openstereo.ui.slope_properties_ui import Ui_Dialog as slope_Ui_Dialog
 from openstereo.os_math import (
     small_circle,
     great_circle,
-    resolve_sense,
+    resolve_senses,
 )
 from openstereo.os_auttitude import load, DirectionalData
 from openstereo import os_auttitude as autti
-from openstereo.io import get_data, split_attitude
+from openstereo.io import load_data, split_attitude
 from openstereo.plot_data import (
     PointPlotData,
     CirclePlotData,
@@ -312,11 +312,11 @@ class CircularData(DataItem):
             from_ = radians(self.rose_settings["intervalfrom"])
             to_ = radians(self.rose_settings["intervalto"])
         if self.rose_check_settings["weightcolumn"]:
-            data_weight = np.array(
-                [
-                    float(line[self.rose_settings["weightcolumn"]])
-                    for line in self.auttitude_data.input_data
-                ]
+            # blank or non numeric weights count as zero, as on load
+            data_weight = np.nan_to_num(
+                self.auttitude_data.attributes.column(
+                    self.rose_settings["weightcolumn"]
+                )
             )
         else:
             data_weight = None
@@ -426,6 +426,7 @@ class AttitudeData(CircularData):  # TODO: change name to VectorData
     data_type = "attitude_data"
     auttitude_class = au.VectorSet
     singledata_auttitude_class = au.Vector
+    contour_counting_grid = None
     extractable_order = {
         "Mean Vector": 0,
         "First Eigenvector": 1,
@@ -477,6 +478,7 @@ class AttitudeData(CircularData):  # TODO: change name to VectorData
             "autocount": False,
             "robinjowett": True,
             "digglefisher": False,
+            "adaptive": False,
         }
         self.check_settings = {
             "v1point": True,
@@ -539,9 +541,12 @@ class AttitudeData(CircularData):  # TODO: change name to VectorData
 
         self.data_settings = {"smallcircle": ""}
 
+    # the contour grid, which keeps the previous counts so that only the
+    # changed rows are counted, is kept by the item, see contour_grid
     def reload_data(self):
-        data = get_data(self.data_path, self.auttitude_data.kwargs)
-        self.auttitude_data = load(data, **self.auttitude_data.kwargs)
+        self.auttitude_data = load_data(
+            self.data_path, self.auttitude_data.kwargs
+        )
 
     def reload_data_from_internal(self):
         # data = get_data(self.data_path, self.auttitude_data.kwargs)
@@ -704,18 +709,33 @@ class AttitudeData(CircularData):  # TODO: change name to VectorData
                 )
         return plot_data
 
+    def contour_grid(self):
+        # the counting grid, with the nodes of auttitude's grid, is kept by
+        # the item, so that it is taken from the grid registry only once and
+        # reloaded data only count the rows that changed
+        spacing = self.contour_calc_settings["spacing"]
+        if self.contour_counting_grid is None:
+            self.contour_counting_grid = autti.SphericalGrid(
+                node_spacing=spacing, grid_layout="auttitude"
+            )
+        else:
+            self.contour_counting_grid.change_spacing(spacing)
+        return self.contour_counting_grid
+
     def plot_Contours(self):
-        # grid = self.auttitude_data.grid
-        # grid.change_spacing(self.contour_calc_settings["spacing"])
-        grid = au.stats.SphericalGrid(self.contour_calc_settings["spacing"])
+        grid = self.contour_grid()
         nodes = grid.grid
         if self.contour_check_settings["fisher"]:
             if self.contour_check_settings["autocount"]:
                 if self.contour_check_settings["robinjowett"]:
-                    k = None
+                    # as auttitude's count, which optimises k if not given
+                    try:
+                        k = grid.optimize_k(self.auttitude_data)
+                    except ImportError:
+                        k = None
                 else:
                     try:
-                        k = grid.optimize_k(self.au_object)
+                        k = grid.optimize_k(self.auttitude_data)
                     except ImportError:
                         QtWidgets.QMessageBox.warning(
                             self.parent(),
@@ -725,7 +745,10 @@ class AttitudeData(CircularData):  # TODO: change name to VectorData
                         k = None
             else:
                 k = self.contour_calc_settings["K"]
-            count = self.au_object.count_fisher(k, grid=grid)
+            if self.contour_check_settings.get("adaptive", False):
+                nodes, count = self.adaptive_count("fisher", k)
+            else:
+                count = grid.count_fisher(self.auttitude_data, k)
         else:
             if self.contour_check_settings["autocount"]:
                 if self.contour_check_settings["robinjowett"]:
@@ -736,7 +759,7 @@ class AttitudeData(CircularData):  # TODO: change name to VectorData
                             acos(
                                 1.0
                                 - 1.0
-                                / grid.optimize_k(self.au_object)
+                                / grid.optimize_k(self.auttitude_data)
                             )
                         )
                     except ImportError:
@@ -754,7 +777,10 @@ class AttitudeData(CircularData):  # TODO: change name to VectorData
                         0.141536 * self.contour_calc_settings["scperc"]
                     )
                 )
-            count = self.au_object.count_kamb(theta, grid=grid)
+            if self.contour_check_settings.get("adaptive", False):
+                nodes, count = self.adaptive_count("kamb", theta)
+            else:
+                count = grid.count_kamb(self.auttitude_data, theta)
         return (
             ContourPlotData(
                 nodes,
@@ -766,6 +792,16 @@ class AttitudeData(CircularData):  # TODO: change name to VectorData
             ),
         )
 
+    def adaptive_count(self, method, parameter):
+        # the contour grid, refined around the density peaks, as set by the
+        # adaptive option of the contour settings
+        return self.contour_grid().count_adaptive(
+            self.auttitude_data,
+            method,
+            parameter,
+            levels=self.contour_settings["ncontours"],
+        )
+
     def _plot_Classification(self):
         if self.legend_settings["point"]:
             try:
@@ -930,10 +966,7 @@ class SmallCircleData(DataItem):
         )
         self.au_object = self.auttitude_class(self.auttitude_data.data)
         self.alpha_column = kwargs["alpha_column"]
-        self.alpha = [
-            float(line[self.alpha_column])
-            for line in self.auttitude_data.input_data
-        ]
+        self.alpha = self.auttitude_data.attributes.column(self.alpha_column)
         super(SmallCircleData, self).__init__(name, parent, item_id)
 
     def build_configuration(self):
@@ -957,9 +990,8 @@ class SmallCircleData(DataItem):
         self.legend_settings = {"scaxis": "", "sccirc": ""}
 
     def reload_data(self):
-        data = get_data(self.data_path, self.auttitude_data.kwargs)
-        self.auttitude_data = load(
-            data, calculate_statistics=False, **self.auttitude_data.kwargs
+        self.auttitude_data = load_data(
+            self.data_path, self.auttitude_data.kwargs
         )
 
     def reload_data_from_internal(self):
@@ -1202,32 +1234,25 @@ class FaultData(DataItem):
                 return self.line_item.au_object
             else:
                 return -self.line_item.au_object
-        sense_data = []
-        sense_column = self.data_settings["sensecolumn"]
-        for line in self.line_item.auttitude_data.input_data:
-            if len(line) < sense_column:  # TODO: guarantee column for line
-                continue
-            else:
-                sense_data.append(line[sense_column])
-        oriented_lines = []
-        planes = []
-        has_sense = []
-        tolerance = sin(radians(self.data_settings["filterangle"]))
-        for plane, line, sense in zip(
-            self.plane_item.au_object, self.line_item.au_object, sense_data
-        ):
-            oriented_line, defined_sense = resolve_sense(plane, line, sense)
-            if not self.data_settings["filteranglecheck"]:
-                oriented_lines.append(oriented_line)
-                planes.append(plane)
-                has_sense.append(defined_sense)
-            else:
-                lp = oriented_line.dot(plane)
-                if abs(lp) <= tolerance:  # should this be a tool?
-                    oriented_line = oriented_line - lp*plane
-                    oriented_lines.append(oriented_line/oriented_line.length)
-                    planes.append(plane)
-                    has_sense.append(defined_sense)
+        sense_data = self.line_item.auttitude_data.attributes.text_column(
+            self.data_settings["sensecolumn"]
+        )
+        n = min(
+            len(self.plane_item.au_object),
+            len(self.line_item.au_object),
+            len(sense_data),
+        )
+        planes = np.asarray(self.plane_item.au_object)[:n]
+        oriented_lines, has_sense = resolve_senses(
+            planes, np.asarray(self.line_item.au_object)[:n], sense_data[:n]
+        )
+        if self.data_settings["filteranglecheck"]:
+            tolerance = sin(radians(self.data_settings["filterangle"]))
+            lp = np.einsum("ij,ij->i", oriented_lines, planes)
+            keep = np.abs(lp) <= tolerance  # should this be a tool?
+            planes, has_sense = planes[keep], has_sense[keep]
+            oriented_lines = oriented_lines[keep] - lp[keep, None] * planes
+            oriented_lines /= np.linalg.norm(oriented_lines, axis=1)[:, None]
 
         if not self.data_settings["invertsense"]:
             return au.LineSet(oriented_lines), au.PlaneSet(planes), has_sense
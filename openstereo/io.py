@@ -7,6 +7,15 @@ from os import path
 from PyQt5 import QtWidgets
 import chardet
 
+from openstereo.os_auttitude import (
+    ColumnTable,
+    is_dataset,
+    load,
+    load_dataset,
+    read_cache,
+    read_delimited,
+    write_cache,
+)
 from openstereo.ui.import_dialog_ui import Ui_Dialog as import_dialog_Ui_Dialog
 
 keep_chars = re.compile("\W+")
@@ -234,7 +243,6 @@ class Importer:
         )()
 
     def get_data_csv(self):
-        f = open(self.fname, "r", encoding=self.encoding)
         # f.seek(self.offset)
         if self.do_skip:
             skip_rows = self.skip_rows
@@ -242,12 +250,10 @@ class Importer:
             skip_rows = 0
         if self.has_header:
             skip_rows += self.header_row + 1
-        reader = csv.reader(
-            skip_comments(f, self.comment_marker), **self.dialect
-        )
-        for i in range(skip_rows):
-            next(reader)
-        return reader
+        with open(self.fname, "r", encoding=self.encoding) as f:
+            return read_delimited(
+                f, skip_rows, self.comment_marker, **self.dialect
+            )
 
     def get_data_xlsx(self):
         book = xlrd.open_workbook(self.fname)
@@ -257,9 +263,11 @@ class Importer:
             header_row += self.header_row + 1
         if self.do_skip:
             header_row += self.skip_rows
-        return skip_comments_xlsx(
-            [sheet.row_values(i) for i in range(header_row, sheet.nrows)],
-            self.comment_marker,
+        return ColumnTable.from_rows(
+            skip_comments_xlsx(
+                [sheet.row_values(i) for i in range(header_row, sheet.nrows)],
+                self.comment_marker,
+            )
         )
 
     def get_data_xls(self):
@@ -641,25 +649,24 @@ class ImportDialog(QtWidgets.QDialog, import_dialog_Ui_Dialog):
                 header_row += self.header_row.value() + 1
             if self.do_skip.isChecked():
                 header_row += self.skip_rows.value()
-            return [
+            return ColumnTable.from_rows(
                 sheet.row_values(i) for i in range(header_row, sheet.nrows)
-            ]
+            )
         else:
-            f = open(fname, "r", encoding=self.importer.encoding)
-            f.seek(self.offset)
             if self.do_skip.isChecked():
                 skip_rows = self.skip_rows.value()
             else:
                 skip_rows = 0
             if self.has_header.isChecked():
                 skip_rows += self.header_row.value() + 1
-            reader = csv.reader(
-                skip_comments(f, self.comment_marker.text()),
-                **self.importer.dialect,
-            )
-            for i in range(skip_rows):
-                next(reader)
-            return reader
+            with open(fname, "r", encoding=self.importer.encoding) as f:
+                f.seek(self.offset)
+                return read_delimited(
+                    f,
+                    skip_rows,
+                    self.comment_marker.text(),
+                    **self.importer.dialect,
+                )
 
 
 # region old importer
@@ -1054,15 +1061,14 @@ def get_data(fname, kwargs):
             0 if kwargs["header_row"] is None else kwargs["header_row"] + 1
         )
         header_row += 0 if kwargs["skip_rows"] is None else kwargs["skip_rows"]
-        return skip_comments_xlsx(
-            [sheet.row_values(i) for i in range(header_row, sheet.nrows)],
-            kwargs.get("comment_marker", "#"),
+        return ColumnTable.from_rows(
+            skip_comments_xlsx(
+                [sheet.row_values(i) for i in range(header_row, sheet.nrows)],
+                kwargs.get("comment_marker", "#"),
+            )
         )
     else:
         encoding = kwargs.get("encoding", "utf-8-sig")
-        f = open(fname, "r", encoding=encoding)
-        if kwargs.get("is_geoeas", False):
-            f.seek(kwargs["geoeas_offset"])
         skip_rows = (
             0 if kwargs["header_row"] is None else kwargs["header_row"] + 1
         )
@@ -1070,12 +1076,27 @@ def get_data(fname, kwargs):
         dialect_data = {}
         for key, item in list(kwargs["dialect_data"].items()):
             dialect_data[key] = str(item) if isinstance(item, str) else item
-        reader = csv.reader(
-            skip_comments(f, kwargs.get("comment_marker", "#")), **dialect_data
-        )
-        for i in range(skip_rows):  # TODO: check if this should be before
-            next(reader)
-        return reader
+        with open(fname, "r", encoding=encoding) as f:
+            if kwargs.get("is_geoeas", False):
+                f.seek(kwargs["geoeas_offset"])
+            # TODO: check if skip_rows should be before the comments
+            return read_delimited(
+                f,
+                skip_rows,
+                kwargs.get("comment_marker", "#"),
+                **dialect_data,
+            )
+
+
+def load_data(fname, kwargs):
+    # parses the file only if it isn't cached already (see read_cache)
+    if is_dataset(fname):
+        return load_dataset(fname, **kwargs)
+    data = read_cache(fname, kwargs)
+    if data is None:
+        data = load(get_data(fname, kwargs), **kwargs)
+        write_cache(data, fname, kwargs)
+    return data
 
 
 def skip_comments(iterable, comment="#"):  # TODO: skip comments in xlsx
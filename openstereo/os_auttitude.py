@@ -1,14 +1,30 @@
 import math
 from math import radians, pi, sin, asin, cos, acos, degrees, sqrt
 import itertools
+from functools import partial
 import os
-from csv import Sniffer, reader
+import hashlib
+import shutil
+import tempfile
+from csv import Sniffer, reader, writer, QUOTE_MINIMAL, QUOTE_NONE
+import json
 
 sniffer = Sniffer()
 import multiprocessing
-from multiprocessing import cpu_count, Pipe
+from multiprocessing import cpu_count
+from collections import OrderedDict
+from collections.abc import Mapping
+import atexit
+import pickle
+import weakref
+
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError:  # python < 3.8
+    shared_memory = None
 
 import numpy as np
+from appdirs import user_cache_dir
 
 # from openstereo.conversion import Attitude
 
@@ -28,6 +44,68 @@ else:
 # set this for experimental multi-core support.
 multicore_when_possible = False
 
+# upper bound, in bytes, for the temporary arrays built while counting.
+counting_memory_limit = 64 * 2 ** 20
+
+# numpy float type in which cosines and kernels are computed when counting.
+# Single precision (np.float32) roughly doubles the counting throughput and
+# halves its memory, see SphericalGrid.check_precision for its accuracy.
+counting_precision = np.float64
+
+# smallest number of grid x data pairs worth sending to the worker processes.
+parallel_threshold = 2 ** 22
+
+# smallest dataset counted through a SphericalIndex, when scipy is available,
+# and the largest counting cone, as 1 - cos(angle), for which it pays off.
+spatial_index_threshold = 10000
+spatial_index_max_cone = 0.05
+
+# number of data over which the likelihood is evaluated when optimizing k,
+# the histogram bins used when the distances between data don't fit in
+# memory, and the range (of log k) searched.
+optimize_k_sample = 2000
+optimize_k_bins = 2048
+optimize_k_bounds = (math.log(0.01), math.log(10000.0))
+
+# number of times the adaptive counting grids are refined, and the largest
+# difference between the counts of close nodes, relative to the maximum
+# count, left unrefined.
+adaptive_grid_depth = 2
+adaptive_grid_threshold = 0.05
+
+# default largest contribution of a single datum left out by the truncated
+# fisher counter, and the node spacing of the cells it buckets the data into.
+fisher_tolerance = 1e-6
+index_cell_spacing = 6.0
+
+# number of rows parsed into columns at a time by ColumnTable.from_rows.
+column_chunk_size = 4096
+
+# number of rows read and translated at a time by accumulate_statistics.
+statistics_chunk_size = 100000
+
+# number of resamples drawn for bootstrap confidence intervals, and how many
+# of them are drawn at a time (each batch with its own random seed).
+bootstrap_resamples = 1000
+bootstrap_batch = 100
+
+# smallest dataset counted on continuous roses by convolving the counting
+# kernel with a histogram of the azimuths on a lattice this fine (in degrees),
+# rather than comparing every datum to every node. The petals then differ
+# from the exact counts by a few data near their edges (see count_lattice),
+# about 3e-4 of the largest petal from this size on, below what can be
+# drawn.
+rose_lattice_threshold = 50000
+rose_lattice_resolution = 0.01
+
+# directory of the binary cache of loaded datasets (see read_cache). Unless
+# cache_enabled is set (and cache_directory isn't None), they are parsed from
+# their source files every time. The least recently used datasets are removed
+# from the cache once it holds more than cache_size_limit bytes.
+cache_directory = user_cache_dir("OpenStereo")
+cache_enabled = True
+cache_size_limit = 1024 * 2 ** 20
+
 rotation_to_direction = np.array(((0.0, 1.0), (-1.0, 0.0)))
 
 
@@ -100,7 +178,58 @@ def equal_area(data):
 
 def concatenate(A, B):
     """Concatenate A and B directional datasets, retaining A's additional attributes"""
-    return DirectionalData(np.vstack((A.data, B.data)), *A.args, **A.kwargs)
+    weights = (
+        None
+        if A.weights is None and B.weights is None
+        else np.concatenate(
+            (
+                np.ones(A.n) if A.weights is None else A.weights,
+                np.ones(B.n) if B.weights is None else B.weights,
+            )
+        )
+    )
+    return DirectionalData(
+        np.vstack((A.data, B.data)), *A.args, weights=weights, **A.kwargs
+    )
+
+
+def aggregate_directions(direction_cosines, weights=None, resolution=None):
+    """\
+Merges repeated directions into weighted unique directions, returning them
+and their summed weights. If resolution is given, in degrees, directions
+whose attitudes round to the same multiple of it are merged into their
+(weighted) mean direction, otherwise only exact duplicates are merged."""
+    data = np.asarray(direction_cosines, dtype=float)
+    n, d = data.shape
+    weights = np.ones(n) if weights is None else np.asarray(weights, float)
+    if resolution is None:
+        keys = data
+    elif d == 3:
+        keys = np.round(sphere(data) / resolution)
+        keys[:, 0] %= round(360.0 / resolution)
+        keys[keys[:, 1] == 0.0, 0] = 0.0  # every azimuth of a vertical pole
+        keys = np.column_stack((keys, np.copysign(1.0, data[:, 2])))
+    else:
+        keys = np.round(circle(data) / resolution)[:, None]
+        keys %= round(360.0 / resolution)
+    keys, index, inverse = np.unique(
+        keys, axis=0, return_index=True, return_inverse=True
+    )
+    inverse = inverse.ravel()
+    unique_weights = np.bincount(inverse, weights, minlength=index.size)
+    if resolution is None:
+        return data[index], unique_weights
+    directions = np.column_stack(
+        [
+            np.bincount(inverse, weights * data[:, i], minlength=index.size)
+            for i in range(d)
+        ]
+    )
+    norms = np.linalg.norm(directions, axis=1)
+    merged = norms > 0.0
+    directions[merged] /= norms[merged, None]
+    directions[~merged] = data[index[~merged]]
+    return directions, unique_weights
 
 
 def intersect(A, B):
@@ -114,43 +243,161 @@ def intersect(A, B):
     return DirectionalData(intersections, *A.args, **A.kwargs)
 
 
+def _grid_rings(node_spacing):
+    """\
+Returns the colatitude and azimuths of each ring of the regular grids, as
+flat arrays with one entry per node, along with the azimuth spacing of the
+last ring, which is also used for the equator."""
+    spacing = math.radians(node_spacing)
+    phis = np.arange(node_spacing, 90.0, node_spacing)
+    # with math, as before, so that the rings hold exactly the same nodes
+    azimuth_spacings = np.array(
+        [
+            math.degrees(
+                2 * math.asin((math.sin(spacing / 2) / math.sin(radians(phi))))
+            )
+            for phi in phis
+        ]
+    )
+    counts = np.array(
+        [len(np.arange(0.0, 360.0, step)) for step in azimuth_spacings],
+        dtype=int,
+    )
+    ring = np.repeat(np.arange(phis.size), counts)
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    position = np.arange(ring.size) - first
+    return phis[ring], position * azimuth_spacings[ring], azimuth_spacings[-1]
+
+
 def regular_grid(node_spacing):
     """\
 Builds a regular grid over the hemisphere, with the given average node spacing."""
-    nodes = [(0.0, 90.0)]
-    spacing = math.radians(node_spacing)
-    for phi in np.arange(
-        node_spacing, 90.0, node_spacing
-    ):
-        azimuth_spacing = math.degrees(
-            2
-            * math.asin((math.sin(spacing / 2) / math.sin(math.radians(phi))))
+    phi, theta, azimuth_spacing = _grid_rings(node_spacing)
+    equator = np.arange(0.0, 360.0, azimuth_spacing)
+    return np.concatenate(
+        (
+            [(0.0, 90.0)],
+            np.column_stack((theta + phi + node_spacing / 2, 90.0 - phi)),
+            np.column_stack(
+                (
+                    (equator + 90.0 + node_spacing / 2) % 360.0,
+                    np.zeros_like(equator),
+                )
+            ),
         )
-        for theta in np.arange(0.0, 360.0, azimuth_spacing):
-            nodes.append((theta + phi + node_spacing / 2, 90.0 - phi))
-    for theta in np.arange(0.0, 360.0, azimuth_spacing):
-        nodes.append(((theta + 90.0 + node_spacing / 2) % 360.0, 0.0))
-    return np.array(nodes)
+    )
 
 
 def sphere_regular_grid(node_spacing):
     """\
 Builds a regular grid over the sphere, with the given average node spacing."""
-    nodes = [(0.0, 90.0), (0, -90.0)]
+    phi, theta, azimuth_spacing = _grid_rings(node_spacing)
+    azimuth = theta + phi + node_spacing / 2
+    # each upper hemisphere node is followed by its lower hemisphere mirror
+    rings = np.stack(
+        (
+            np.column_stack((azimuth, 90.0 - phi)),
+            np.column_stack((azimuth, phi - 90.0)),
+        ),
+        axis=1,
+    ).reshape(-1, 2)
+    equator = np.arange(0.0, 360.0, azimuth_spacing)
+    return np.concatenate(
+        (
+            [(0.0, 90.0), (0, -90.0)],
+            rings,
+            np.column_stack(
+                (
+                    (equator + 90.0 + node_spacing / 2) % 360.0,
+                    np.zeros_like(equator),
+                )
+            ),
+        )
+    )
+
+
+def auttitude_regular_grid(node_spacing):
+    """\
+Builds the grid of auttitude's SphericalGrid, with the same nodes in the
+same order: each upper hemisphere node of the rings followed by its
+antipode, then the equator, at node_spacing apart."""
     spacing = math.radians(node_spacing)
-    for phi in np.arange(
-        node_spacing, 90.0,  node_spacing
-    ):
+    rings = []
+    for phi in np.arange(node_spacing, 90.0, node_spacing):
         azimuth_spacing = math.degrees(
-            2
-            * math.asin((math.sin(spacing / 2) / math.sin(math.radians(phi))))
+            2 * math.asin((math.sin(spacing / 2) / math.sin(radians(phi))))
+        )
+        theta = np.linspace(
+            0.0, 360.0 - azimuth_spacing, int(360.0 // azimuth_spacing)
         )
-        for theta in np.arange(0.0, 360.0, azimuth_spacing):
-            nodes.append((theta + phi + node_spacing / 2, 90.0 - phi))
-            nodes.append((theta + phi + node_spacing / 2, phi - 90.0))
-    for theta in np.arange(0.0, 360.0, azimuth_spacing):
-        nodes.append(((theta + 90.0 + node_spacing / 2) % 360.0, 0.0))
-    return np.array(nodes)
+        rings.append(
+            np.stack(
+                (
+                    np.column_stack(
+                        (
+                            theta + phi + node_spacing / 2,
+                            np.full(theta.size, 90.0 - phi),
+                        )
+                    ),
+                    np.column_stack(
+                        (
+                            theta - 180 + phi + node_spacing / 2,
+                            np.full(theta.size, phi - 90.0),
+                        )
+                    ),
+                ),
+                axis=1,
+            ).reshape(-1, 2)
+        )
+    equator = np.arange(0.0, 360.0, node_spacing)
+    return np.concatenate(
+        [[(0.0, 90.0)]]
+        + rings
+        + [
+            np.column_stack(
+                (
+                    (equator + 90.0 + node_spacing / 2) % 360.0,
+                    np.zeros_like(equator),
+                )
+            )
+        ]
+    )
+
+
+# the builders of the grids over the sphere that SphericalGrid can count on,
+# by the name given as its grid_layout option
+grid_layouts = {
+    "regular": sphere_regular_grid,
+    "auttitude": auttitude_regular_grid,
+}
+
+# counting grids built so far, by node spacing, whether they cover the whole
+# sphere and their layout, as read-only (node attitudes, direction cosines)
+# pairs.
+_grid_registry = OrderedDict()
+grid_registry_size = 16
+
+
+def registered_grid(node_spacing, sphere=True, layout="regular"):
+    """\
+Returns the node attitudes and direction cosines of the regular grid over
+the sphere (or the hemisphere, if sphere is False) with the given node
+spacing, built as named by layout (see grid_layouts) if over the sphere.
+Grids are built once and kept, read-only, in a process-wide registry of the
+last grid_registry_size grids used."""
+    key = (float(node_spacing), bool(sphere), layout if sphere else None)
+    if key in _grid_registry:
+        _grid_registry.move_to_end(key)
+        return _grid_registry[key]
+    nodes = (grid_layouts[layout] if sphere else regular_grid)(node_spacing)
+    nodes = np.ascontiguousarray(nodes)
+    grid = np.ascontiguousarray(dcos_lines(nodes))
+    nodes.setflags(write=False)
+    grid.setflags(write=False)
+    _grid_registry[key] = nodes, grid
+    while len(_grid_registry) > grid_registry_size:
+        _grid_registry.popitem(last=False)
+    return nodes, grid
 
 
 def universal_loader(fin, extension=None, worksheet=0, dialect=None):
@@ -185,6 +432,354 @@ the proper specific loader."""
     return input_data
 
 
+def _translate_line(
+    line,
+    longitude_column,
+    colatitude_column,
+    dip_direction,
+    circular,
+    obliquity_column,
+    obliquity_sense_column,
+    rake,
+):
+    # translates a single row, raising ValueError or IndexError if it can't
+    if circular:
+        return au.translate_attitude(
+            line[longitude_column], "45", strike=not dip_direction
+        )[0]
+    translated_line = list(
+        au.translate_attitude(
+            line[longitude_column],
+            line[colatitude_column],
+            strike=not dip_direction,
+        )
+    )
+    if rake:
+        if obliquity_sense_column is None:
+            translated_line.append(float(line[obliquity_column]))
+        else:
+            dd = translated_line[0]
+            rake = float(line[obliquity_column])
+            sense = line[obliquity_sense_column].lower()
+            if 0 < dd <= 90:
+                if sense in "nw":
+                    translated_line.append(rake)
+                else:
+                    translated_line.append(180 - rake)
+            elif 90 < dd <= 180:
+                if sense in "ne":
+                    translated_line.append(rake)
+                else:
+                    translated_line.append(180 - rake)
+            elif 180 < dd <= 270:
+                if sense in "se":
+                    translated_line.append(rake)
+                else:
+                    translated_line.append(180 - rake)
+            else:  # 270 < dd < 0
+                if sense in "sw":
+                    translated_line.append(rake)
+                else:
+                    translated_line.append(180 - rake)
+    return translated_line
+
+
+def _float_column(data, column):
+    # the column as floats, nan where it isn't a number or the row too short
+    if isinstance(data, ColumnTable):
+        return data.column(column)
+    if isinstance(data, np.ndarray) and data.ndim == 1:
+        # such as np.loadtxt returns for files of a single column
+        data = data.reshape(-1, 1)
+    if isinstance(data, np.ndarray) and data.ndim == 2:
+        if data.dtype.kind in "fiu":
+            if column < data.shape[1]:
+                return data[:, column].astype(float)
+            return np.full(data.shape[0], np.nan)
+    values = [line[column] if len(line) > column else None for line in data]
+    try:
+        return np.array(values, dtype=float)
+    except (ValueError, TypeError):
+        return np.array([_parse_float(value) for value in values])
+
+
+class ColumnTable(object):
+    """\
+Rows of input data stored by column: a float array per column, nan where a
+cell isn't a number, and only for columns that have any such cells, an
+object array with their text (None elsewhere). It reads as a sequence of
+rows, so it can stand for a list of rows, while column gives the parsed
+values of a whole column at once."""
+
+    def __init__(self, numbers, text=None):
+        self.numbers = numbers
+        self.text = [None] * len(numbers) if text is None else text
+
+    @classmethod
+    def from_rows(cls, rows, chunk_size=None):
+        """\
+Parses an iterable of rows (sequences of strings or numbers), in chunks of
+chunk_size (column_chunk_size if not given) rows, into a ColumnTable. Short
+rows get empty cells."""
+        if isinstance(rows, np.ndarray) and rows.dtype.kind in "fiu":
+            rows = rows.astype(float).reshape(len(rows), -1)
+            return cls(list(rows.T.copy()))
+        chunk_size = column_chunk_size if chunk_size is None else chunk_size
+        rows = iter(rows)
+        chunks = []
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                break
+            chunks.append(
+                (
+                    len(chunk),
+                    [
+                        _parse_cells(cells)
+                        for cells in itertools.zip_longest(
+                            *chunk, fillvalue=""
+                        )
+                    ],
+                )
+            )
+        width = max((len(columns) for size, columns in chunks), default=0)
+        numbers, text = [], []
+        for column in range(width):
+            parsed = [
+                columns[column]
+                if column < len(columns)
+                else (np.full(size, np.nan), np.full(size, "", dtype=object))
+                for size, columns in chunks
+            ]
+            numbers.append(np.concatenate([cells for cells, _ in parsed]))
+            if all(cells_text is None for _, cells_text in parsed):
+                text.append(None)
+            else:
+                text.append(
+                    np.concatenate(
+                        [
+                            np.full(len(cells), None, dtype=object)
+                            if cells_text is None
+                            else cells_text
+                            for cells, cells_text in parsed
+                        ]
+                    )
+                )
+        return cls(numbers, text)
+
+    @classmethod
+    def concatenate(cls, tables):
+        """\
+Joins the rows of the given ColumnTables into a single one. Tables narrower
+than the widest get empty cells, as short rows do in from_rows."""
+        tables = [table for table in tables if len(table)]
+        width = max((table.width for table in tables), default=0)
+        numbers, text = [], []
+        for column in range(width):
+            parts = [
+                (table.numbers[column], table.text[column])
+                if column < table.width
+                else (
+                    np.full(len(table), np.nan),
+                    np.full(len(table), "", dtype=object),
+                )
+                for table in tables
+            ]
+            numbers.append(np.concatenate([cells for cells, _ in parts]))
+            if all(cells_text is None for _, cells_text in parts):
+                text.append(None)
+            else:
+                text.append(
+                    np.concatenate(
+                        [
+                            np.full(len(cells), None, dtype=object)
+                            if cells_text is None
+                            else cells_text
+                            for cells, cells_text in parts
+                        ]
+                    )
+                )
+        return cls(numbers, text)
+
+    def __len__(self):
+        return len(self.numbers[0]) if self.numbers else 0
+
+    def __getitem__(self, row):
+        return [
+            numbers[row] if text is None or text[row] is None else text[row]
+            for numbers, text in zip(self.numbers, self.text)
+        ]
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self[row]
+
+    @property
+    def width(self):
+        return len(self.numbers)
+
+    def cell(self, row, column):
+        """\
+Returns the text of a single cell, as shown and edited in the data table:
+its text if it isn't a number, the number as written by _format_number, or
+an empty string if the row has no such cell."""
+        if column >= self.width:
+            return ""
+        text = self.text[column]
+        if text is not None and text[row] is not None:
+            return text[row]
+        number = self.numbers[column][row]
+        return _format_number(number) if np.isfinite(number) else ""
+
+    def column(self, column):
+        """\
+Returns the values of a column as floats, nan where they aren't numbers."""
+        if column < self.width:
+            return self.numbers[column]
+        return np.full(len(self), np.nan)
+
+    def text_column(self, column):
+        """\
+Returns the cells of a column as strings, with numbers written back by
+_format_number and empty strings for missing cells."""
+        if column >= self.width:
+            return np.full(len(self), "", dtype=object)
+        numbers, text = self.numbers[column], self.text[column]
+        # each distinct number is only written once
+        distinct, inverse = np.unique(numbers, return_inverse=True)
+        cells = np.array([_format_number(x) for x in distinct], dtype=object)
+        cells = cells[inverse.ravel()]
+        if text is not None:
+            has_text = np.not_equal(text, None)
+            cells[has_text] = text[has_text]
+        return cells
+
+    def take(self, rows):
+        """\
+Returns a ColumnTable of the given rows, in that order, or this same table
+if rows is None or all of its rows in order."""
+        if rows is None:
+            return self
+        rows = np.asarray(rows, dtype=int)
+        if len(rows) == len(self) and (rows == np.arange(len(rows))).all():
+            return self
+        return ColumnTable(
+            [numbers[rows] for numbers in self.numbers],
+            [None if text is None else text[rows] for text in self.text],
+        )
+
+
+def _format_number(number):
+    # the shortest text that reads back as the same number, without the
+    # trailing .0 of whole numbers, as they are usually written in the files
+    text = repr(float(number))
+    return text[:-2] if text.endswith(".0") else text
+
+
+def _parse_cells(cells):
+    # a column of cells as floats, and their text if any isn't a number
+    try:
+        return np.array(cells, dtype=float), None
+    except (ValueError, TypeError):
+        strings = np.array(cells, dtype=str)
+        numbers = np.full(len(strings), np.nan)
+        filled = strings != ""
+        try:
+            numbers[filled] = strings[filled].astype(float)
+        except ValueError:
+            # text columns mostly repeat a few values, so parse each once
+            distinct, inverse = np.unique(strings, return_inverse=True)
+            numbers = np.array([_parse_float(cell) for cell in distinct])
+            numbers = numbers[inverse.ravel()]
+        text = np.empty(len(cells), dtype=object)
+        text[:] = cells
+        text[np.isfinite(numbers)] = None
+        return numbers, text
+
+
+def read_delimited(f, skip_rows=0, comment=None, chunk_size=None, **dialect):
+    """\
+Reads delimited text into a ColumnTable in a single pass, from f, a filename
+or an iterable of lines, given the options of csv.reader. Lines starting with
+comment are dropped, then the first skip_rows lines (such as headers), and
+blank rows. The lines are read as a stream, chunk_size (column_chunk_size
+if not given) at a time. Chunks with as many cells in every row are split by
+numpy.loadtxt, anything else by csv.reader, so cells spanning lines aren't
+supported."""
+    if isinstance(f, str):
+        with open(f) as fin:
+            return read_delimited(
+                fin, skip_rows, comment, chunk_size, **dialect
+            )
+    chunk_size = column_chunk_size if chunk_size is None else chunk_size
+    lines = (line for line in f if not (comment and line.startswith(comment)))
+    lines = itertools.islice(lines, skip_rows, None)
+    tables = []
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            return ColumnTable.concatenate(tables)
+        tables.append(_read_delimited_chunk(chunk, dialect))
+
+
+def _read_delimited_chunk(lines, dialect):
+    # the lines as a ColumnTable, split by numpy.loadtxt if they can be
+    cells = _split_cells(lines, dialect)
+    if cells is not None:
+        columns = [_parse_cells(column) for column in cells.T]
+        if all(_plain_text(text, dialect) for _, text in columns):
+            return ColumnTable(
+                [numbers for numbers, _ in columns],
+                [text for _, text in columns],
+            )
+    rows = reader(lines, **dialect)
+    return ColumnTable.from_rows(row for row in rows if row)
+
+
+def _split_cells(lines, dialect):
+    # the cells of the lines as an object array, if every row has as many
+    if dialect.get("escapechar") or not any(line.strip() for line in lines):
+        return None
+    delimiter = dialect.get("delimiter", ",")
+    if delimiter == " " and dialect.get("skipinitialspace"):
+        if any("\t" in line for line in lines):
+            return None
+        delimiter = None  # any run of spaces, as csv.reader would split it
+    quoting = dialect.get("quoting", QUOTE_MINIMAL) != QUOTE_NONE
+    try:
+        return np.loadtxt(
+            lines,
+            dtype=object,
+            delimiter=delimiter,
+            quotechar=dialect.get("quotechar", '"') if quoting else None,
+            comments=None,
+            ndmin=2,
+        )
+    except ValueError:
+        return None
+
+
+def _plain_text(text, dialect):
+    # strips the text cells split by numpy.loadtxt as csv.reader would, and
+    # tells whether they can be kept, that is, none is still quoted
+    if text is None:
+        return True
+    distinct = set(text.tolist())
+    if dialect.get("skipinitialspace") and any(
+        cell is not None and cell.startswith(" ") for cell in distinct
+    ):
+        stripped = {
+            cell: None if cell is None else cell.lstrip(" ")
+            for cell in distinct
+        }
+        text[:] = [stripped[cell] for cell in text.tolist()]
+        distinct = set(stripped.values())
+    quotechar = dialect.get("quotechar", '"')
+    return not quotechar or not any(
+        cell is not None and cell.startswith(quotechar) for cell in distinct
+    )
+
+
 def universal_translator(
     data,
     longitude_column=0,
@@ -194,77 +789,73 @@ def universal_translator(
     circular=False,
     obliquity_column=2,
     obliquity_sense_column=None,
-    rake=False
+    rake=False,
+    return_rows=False,
 ):
     """Translates data from many different notations into dipdirection/dip,
-    semi-automatically"""
-    translated_data = []
+    semi-automatically. If return_rows is set, also returns the index of the
+    input row of each translated datum, as unreadable rows are skipped.
+    Rows given as plain numbers are translated a whole column at a time, and
+    only the others (such as quadrant notation) one by one."""
+    if not isinstance(data, (list, np.ndarray, ColumnTable)):
+        data = list(data)
+    longitude = _float_column(data, longitude_column)
+    if not dip_direction:  # right hand rule, as in au.translate_attitude
+        longitude = (longitude + 90.0) % 360.0
+    columns = [longitude]
     if not circular:
-        for line in data:
-            try:
-                translated_line = list(
-                    au.translate_attitude(
-                        line[longitude_column],
-                        line[colatitude_column],
-                        strike=not dip_direction,
-                    )
-                )
-                if rake:
-                    if obliquity_sense_column is None:
-                        translated_line.append(float(line[obliquity_column]))
-                    else:
-                        dd = translated_line[0]
-                        rake = float(line[obliquity_column])
-                        sense = line[obliquity_sense_column].lower()
-                        if 0 < dd <= 90:
-                            if sense in "nw":
-                                translated_line.append(rake)
-                            else:
-                                translated_line.append(180 - rake)
-                        elif 90 < dd <= 180:
-                            if sense in "ne":
-                                translated_line.append(rake)
-                            else:
-                                translated_line.append(180 - rake)
-                        elif 180 < dd <= 270:
-                            if sense in "se":
-                                translated_line.append(rake)
-                            else:
-                                translated_line.append(180 - rake)
-                        else:  # 270 < dd < 0
-                            if sense in "sw":
-                                translated_line.append(rake)
-                            else:
-                                translated_line.append(180 - rake)
-            except (ValueError, IndexError):
-                continue
-            translated_data.append(translated_line)
-        # translated_data = np.array([
-        #     au.translate_attitude(
-        #         line[longitude_column],
-        #         line[colatitude_column],
-        #         strike=not dip_direction) for line in data if line
-        # ])
-    else:
-        # translated_data = np.array(
-        #     [
-        #         au.translate_attitude(
-        #             line[longitude_column], "45", strike=not dip_direction
-        #         )
-        #         for line in data
-        #         if line
-        #     ]
-        # )[:, 0]
-        for line in data:
-            try:
-                translated_data.append(
-                    au.translate_attitude(
-                        line[longitude_column], "45", strike=not dip_direction
-                    )[0]
+        columns.append(_float_column(data, colatitude_column))
+        if rake:
+            columns.append(
+                _float_column(data, obliquity_column)
+                if obliquity_sense_column is None
+                else np.full(len(data), np.nan)
+            )
+    columns = np.array(columns).T
+    numeric = np.isfinite(columns).all(axis=1)
+    numeric_rows = np.flatnonzero(numeric)
+    translated_data = []
+    rows = []
+    for row in np.flatnonzero(~numeric):
+        try:
+            translated_data.append(
+                _translate_line(
+                    data[row],
+                    longitude_column,
+                    colatitude_column,
+                    dip_direction,
+                    circular,
+                    obliquity_column,
+                    obliquity_sense_column,
+                    rake,
                 )
-            except (ValueError, IndexError):
-                continue
-    return np.array(translated_data)
+            )
+        except (ValueError, IndexError):
+            continue
+        rows.append(row)
+    translated_data = np.concatenate(
+        (
+            columns[numeric_rows],
+            np.reshape(translated_data, (len(rows), columns.shape[1])),
+        )
+    )
+    rows = np.concatenate((numeric_rows, np.array(rows, dtype=int)))
+    order = np.argsort(rows, kind="stable")
+    translated_data, rows = translated_data[order], rows[order]
+    if circular:
+        translated_data = translated_data[:, 0]
+    elif not len(rows):
+        translated_data = np.array([])
+    if return_rows:
+        return translated_data, rows
+    return translated_data
+
+
+def _parse_float(value):
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
 
 
 def load(fin, *args, **kwargs):
@@ -275,7 +866,15 @@ and universal_loader signatures for additional information. Important options:
 dip_direction, defaults True:
 interpret data as dip direction, or strike if set to False.
 line, defaults to False:
-interpret data as lines, instead of planes."""
+interpret data as lines, instead of planes.
+weight_column, defaults to None:
+weight each datum by the value in this column, or zero if it has none.
+If keep_input or weight_column is set, the input is parsed once into a
+ColumnTable, kept as input_data if keep_input is set, and its rows that hold
+the returned data, in the same order, become their attributes.
+Datasets saved by save_dataset are opened by load_dataset instead."""
+    if isinstance(fin, str) and is_dataset(fin):
+        return load_dataset(fin, *args, **kwargs)
     extension = kwargs.get("extension", None)
     worksheet = kwargs.get("worksheet", 0)
     if isinstance(fin, str):
@@ -287,8 +886,6 @@ interpret data as lines, instead of planes."""
         )
     else:
         input_data = fin
-    if kwargs.get("keep_input", False):
-        input_data = kwargs["input_data"] = list(input_data)
     dip_direction = kwargs.get("dip_direction", True)
     line = kwargs.get("line", False)
     longitude_column = (
@@ -302,9 +899,19 @@ interpret data as lines, instead of planes."""
     rake = kwargs.get("rake", False)
     obliquity_column = kwargs.get("obliquity_column", 2)
     obliquity_sense_column = kwargs.get("obliquity_sense_column", None)
-    converted_data = (
-        universal_translator(
-            input_data,
+    weight_column = kwargs.get("weight_column", None)
+    parse_columns = kwargs.get("keep_input", False) or (
+        weight_column is not None
+    )
+    table = input_data
+    if parse_columns and not isinstance(input_data, ColumnTable):
+        # parsed once, as a csv reader can only be read once anyway
+        table = ColumnTable.from_rows(input_data)
+    if kwargs.get("keep_input", False):
+        kwargs["input_data"] = table
+    if translate:
+        converted_data, rows = universal_translator(
+            table,
             longitude_column=longitude_column,
             colatitude_column=colatitude_column,
             colatitude=line,
@@ -312,11 +919,19 @@ interpret data as lines, instead of planes."""
             circular=circular,
             rake=rake,
             obliquity_column=obliquity_column,
-            obliquity_sense_column=obliquity_sense_column
+            obliquity_sense_column=obliquity_sense_column,
+            return_rows=True,
         )
-        if translate
-        else input_data
-    )
+        if not circular and not len(converted_data):
+            # nothing was readable, such as in a chunk of header lines
+            converted_data = converted_data.reshape(0, 3 if rake else 2)
+    else:
+        converted_data, rows = input_data, None
+    if parse_columns:
+        attributes = kwargs["attributes"] = table.take(rows)
+        if weight_column is not None:
+            # data without a weight count for nothing
+            kwargs["weights"] = np.nan_to_num(attributes.column(weight_column))
     if not circular:
         if rake:
             vector_data = au.dcos_rake(converted_data)
@@ -329,6 +944,257 @@ interpret data as lines, instead of planes."""
     return DirectionalData(vector_data, *args, **kwargs)
 
 
+def save_dataset(fname, data):
+    """\
+Saves directional data to fname as a .npy file of a structured array, with
+a record per datum holding its direction cosines (dcos), its weight (weight,
+if weighted) and its attributes: each column as floats (column_0, column_1
+and so on) and, for columns that have any text, as text too (column_0_text
+and so on), empty where a number was read. These datasets are memory mapped
+by load_dataset, so they can be larger than memory."""
+    attributes = data.attributes
+    fields = [("dcos", float, (data.d,))]
+    if data.weights is not None:
+        fields.append(("weight", float))
+    text = {}
+    for column in range(attributes.width):
+        fields.append(("column_{}".format(column), float))
+        if attributes.text[column] is not None:
+            cells = attributes.text[column]
+            text[column] = np.where(np.not_equal(cells, None), cells, "")
+            text[column] = text[column].astype(str)
+            fields.append(
+                ("column_{}_text".format(column), text[column].dtype)
+            )
+    # written in place, so the data needn't be copied in memory
+    records = np.lib.format.open_memmap(
+        fname, mode="w+", dtype=fields, shape=(data.n,)
+    )
+    records["dcos"] = data.data
+    if data.weights is not None:
+        records["weight"] = data.weights
+    for column in range(attributes.width):
+        records["column_{}".format(column)] = attributes.column(column)
+        if column in text:
+            records["column_{}_text".format(column)] = text[column]
+    records.flush()
+
+
+def load_dataset(fname, *args, **kwargs):
+    """\
+Opens a dataset saved by save_dataset as DirectionalData, memory mapped, so
+that only the parts of it that are used are read, and without translating
+it. Takes the options of load that apply to direction cosines (such as line
+or axial), which aren't stored in the file."""
+    records = np.load(fname, mmap_mode="c")
+    names = records.dtype.names or ()
+    if "dcos" not in names:
+        raise ValueError("{} is not a directional dataset".format(fname))
+    numbers, text = [], []
+    while "column_{}".format(len(numbers)) in names:
+        column = len(numbers)
+        numbers.append(records["column_{}".format(column)])
+        if "column_{}_text".format(column) in names:
+            cells = records["column_{}_text".format(column)].astype(object)
+            cells[np.isfinite(numbers[column])] = None
+            text.append(cells)
+        else:
+            text.append(None)
+    attributes = kwargs["attributes"] = ColumnTable(numbers, text)
+    if kwargs.get("weight_column") is not None:
+        # data without a weight count for nothing, as in load
+        kwargs["weights"] = np.nan_to_num(
+            attributes.column(kwargs["weight_column"])
+        )
+    elif "weight" in names:
+        kwargs["weights"] = records["weight"]
+    return DirectionalData(records["dcos"], *args, **kwargs)
+
+
+def is_dataset(fname):
+    """Tells whether fname is a dataset saved by save_dataset."""
+    if os.path.splitext(fname)[-1].lower() != ".npy":
+        return False
+    try:
+        records = np.load(fname, mmap_mode="r")
+    except (OSError, ValueError):
+        return False
+    return "dcos" in (records.dtype.names or ())
+
+
+def read_cache(fname, kwargs):
+    """\
+Returns the data loaded from the file fname with the options kwargs (see
+load) from the cache, its arrays memory mapped, or None if they weren't
+cached, the file changed since or the cache is disabled."""
+    if not cache_enabled or cache_directory is None:
+        return None
+    try:
+        entry, stamp = _cache_entry(fname, kwargs)
+        schema_path = os.path.join(entry, "schema.json")
+        with open(schema_path) as f:
+            schema = json.load(f)
+        if schema["stamp"] != stamp:
+            return None
+        data = _load_arrays(entry, schema, **kwargs)
+        # marks the entry as just used, see _prune_cache
+        os.utime(schema_path)
+        return data
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def write_cache(data, fname, kwargs):
+    """\
+Stores the data loaded from the file fname with the options kwargs (see
+load) in the cache, as numpy arrays, replacing what was cached for them,
+and removes the least recently used datasets if the cache grew beyond
+cache_size_limit."""
+    if not cache_enabled or cache_directory is None:
+        return
+    try:
+        entry, stamp = _cache_entry(fname, kwargs)
+        os.makedirs(cache_directory, exist_ok=True)
+        directory = tempfile.mkdtemp(dir=cache_directory)
+    except OSError:
+        return
+    try:
+        schema = dict(_save_arrays(directory, data), stamp=stamp)
+        with open(os.path.join(directory, "schema.json"), "w") as f:
+            json.dump(schema, f)
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(directory, entry)
+    except OSError:  # the cache only saves time, so it can be left out
+        shutil.rmtree(directory, ignore_errors=True)
+        return
+    _prune_cache(entry)
+
+
+def _prune_cache(keep):
+    # removes the least recently used entries of the cache (by the time their
+    # schema was last written or read) but keep, until the cache is no larger
+    # than cache_size_limit
+    entries = []
+    try:
+        names = os.listdir(cache_directory)
+    except OSError:
+        return
+    for name in names:
+        entry = os.path.join(cache_directory, name)
+        try:
+            used = os.stat(os.path.join(entry, "schema.json")).st_mtime_ns
+            size = sum(
+                os.path.getsize(os.path.join(entry, array))
+                for array in os.listdir(entry)
+            )
+        except OSError:  # not an entry, or one still being written
+            continue
+        entries.append((used, size, entry))
+    total = sum(size for _, size, _ in entries)
+    for used, size, entry in sorted(entries):
+        if total <= cache_size_limit:
+            break
+        if entry != keep:
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+
+def _cache_entry(fname, kwargs):
+    # the directory caching a file loaded with the given options, and the
+    # stamp of the file's current version
+    key = json.dumps(
+        [os.path.abspath(fname), kwargs], sort_keys=True, default=str
+    )
+    entry = os.path.join(
+        cache_directory, hashlib.sha1(key.encode("utf-8")).hexdigest()
+    )
+    stat = os.stat(fname)
+    stamp = {"version": 1, "size": stat.st_size, "mtime": stat.st_mtime_ns}
+    return entry, stamp
+
+
+def _save_arrays(directory, data):
+    # saves the arrays of directional data as .npy files, returning their
+    # schema for _load_arrays
+    np.save(os.path.join(directory, "data.npy"), data.data)
+    if data.weights is not None:
+        np.save(os.path.join(directory, "weights.npy"), data.weights)
+    schema = {"weights": data.weights is not None, "input_data": None}
+    if isinstance(data.input_data, ColumnTable):
+        schema["input_data"] = _save_table(
+            directory, "input_data", data.input_data
+        )
+    if data.attributes is data.input_data:
+        schema["attributes"] = "input_data"
+    else:
+        schema["attributes"] = _save_table(
+            directory, "attributes", data.attributes
+        )
+    return schema
+
+
+def _load_arrays(directory, schema, *args, **kwargs):
+    # directional data from the arrays saved by _save_arrays
+    if schema["weights"]:
+        kwargs["weights"] = _load_array(directory, "weights")
+    if schema["input_data"] is not None:
+        kwargs["input_data"] = _load_table(
+            directory, "input_data", schema["input_data"]
+        )
+    if schema["attributes"] == "input_data":
+        kwargs["attributes"] = kwargs["input_data"]
+    else:
+        kwargs["attributes"] = _load_table(
+            directory, "attributes", schema["attributes"]
+        )
+    return DirectionalData(_load_array(directory, "data"), *args, **kwargs)
+
+
+def _save_table(directory, name, table):
+    # saves the numbers of a column table as a single array, with the text
+    # of each column that has any (and where) apart
+    numbers = np.array(table.numbers, dtype=float)
+    np.save(
+        os.path.join(directory, name + ".npy"),
+        numbers.reshape(table.width, len(table)),
+    )
+    text_columns = []
+    for column, text in enumerate(table.text):
+        if text is None:
+            continue
+        has_text = np.not_equal(text, None)
+        np.save(
+            os.path.join(directory, "{}_text_{}.npy".format(name, column)),
+            np.where(has_text, text, "").astype(str),
+        )
+        np.save(
+            os.path.join(directory, "{}_has_text_{}.npy".format(name, column)),
+            has_text,
+        )
+        text_columns.append(column)
+    return {"text": text_columns}
+
+
+def _load_table(directory, name, schema):
+    # a column table from the arrays saved by _save_table
+    numbers = list(_load_array(directory, name))
+    text = [None] * len(numbers)
+    for column in schema["text"]:
+        text[column] = _load_array(
+            directory, "{}_text_{}".format(name, column)
+        ).astype(object)
+        has_text = _load_array(
+            directory, "{}_has_text_{}".format(name, column)
+        )
+        text[column][~has_text] = None
+    return ColumnTable(numbers, text)
+
+
+def _load_array(directory, name):
+    # copy on write, so that only the parts of it that are read are loaded
+    return np.load(os.path.join(directory, name + ".npy"), mmap_mode="c")
+
+
 def calculate_axes(data):
     """Calculates the eigenvectors and eigenvalues of the dispersion matrix of the dataset."""
     dispersion_tensor = np.cov(data.T[:3, :])
@@ -365,129 +1231,697 @@ def rotation_matrix(u, theta):
 
 def rotate(data, u, theta):
     return DirectionalData(
-        np.dot(data.data, rotation_matrix(u, theta)), *data.args, **data.kwargs
+        np.dot(data.data, rotation_matrix(u, theta)),
+        *data.args,
+        weights=data.weights,
+        attributes=data.attributes,
+        **data.kwargs
     )
 
 
 def project(data, new_axes):
     return DirectionalData(
-        np.dot(data.data, new_axes.T), *data.args, **data.kwargs
+        np.dot(data.data, new_axes.T),
+        *data.args,
+        weights=data.weights,
+        attributes=data.attributes,
+        **data.kwargs
     )
 
 
-class DirectionalData(object):
-    def __init__(self, data, *args, **kwargs):
-        """\
-        Base class for directional data analysis, either 2d or 3d. Store optionally
-        additional arguments for plotting."""
-        self.args, self.kwargs = args, kwargs
-        self.data = data
-        self.data_circle = kwargs.get("data_circle", None)
-        self.input_data = kwargs.pop("input_data", [])
-        self.n, self.d = data.shape
+def estimate_khat(R_, n):
+    """\
+Estimates the von Mises concentration of n circular data from their mean
+resultant length. Both may be arrays, which are broadcast together."""
+    R_ = np.asarray(R_, dtype=float)
+    n = np.asarray(n, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        K_ = np.where(
+            R_ < 0.53,
+            2.0 * R_ + (R_ ** 3.0) + (5 * (R_ ** 5.0) / 6.0),
+            np.where(
+                R_ <= 0.85,
+                -0.4 + 1.39 * R_ + 0.43 / (1.0 - R_),
+                1.0 / (R_ ** 3.0 - 4.0 * (R_ ** 2.0) + 3.0 * R_),
+            ),
+        )
+        corrected = (
+            ((0.4 <= K_) & (K_ < 1.0) & (n >= 25))
+            | ((1.0 <= K_) & (K_ < 1.5) & (n >= 15))
+            | ((1.5 <= K_) & (K_ < 2.0) & (n >= 10))
+            | (K_ >= 2.0)
+        )
+        K_ = np.where(
+            corrected,
+            np.where(
+                K_ < 2.0,
+                np.maximum(K_ - 2.0 / (n * K_), 0.0),
+                ((n - 1) ** 3) * K_ / (n + n ** 3),
+            ),
+            K_,
+        )
+    return K_ if K_.ndim else float(K_)
 
+
+def circular_confidence(resultant, n, axial=False, alpha=0.95):
+    """\
+Returns the mean direction of n circular data, given their resultant vector
+(of their doubled angles, as cosine and sine, if axial), and its confidence
+interval, or None if it can't be estimated. Given arrays of resultants (in
+the last axis) and of n, returns arrays of both, with nan for intervals that
+can't be estimated."""
+    resultant = np.asarray(resultant, dtype=float)
+    theta_ = circle(resultant)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        R_ = np.linalg.norm(resultant, axis=-1) / n
+        K_ = estimate_khat(R_, n)
+        sine = ndtri(alpha) / np.sqrt(n * R_ * K_)
+        i = np.degrees(np.arcsin(np.where(np.abs(sine) <= 1.0, sine, np.nan)))
+    if axial:
+        i = i / 2.0
+    if np.ndim(i) == 0:
+        return theta_, None if np.isnan(i) else float(i)
+    return theta_, i
+
+
+class SphericalAccumulator(object):
+    """\
+Accumulates the sums the statistics of DirectionalData are calculated from
+(total weight, resultant vector, orientation tensor and circular resultants)
+over chunks of data, in a single pass, so that data too large for memory can
+be summarised a chunk at a time. The concentrated mean vector is summed with
+each chunk flipped towards the principal axis of the data seen so far, so it
+is only exact if the data is given at once, or summed again by concentrate."""
+
+    # names of the statistics returned by statistics, some only for 3d data.
+    names = (
+        "resultant_vector",
+        "mean_resultant_vector",
+        "mean_vector",
+        "resultant_length",
+        "mean_resultant_length",
+        "resultant_vector_sphere",
+        "fisher_k",
+        "eigenvalues",
+        "eigenvectors",
+        "eigenvectors_sphere",
+        "concentrated_mean_vector",
+        "vollmer_P",
+        "vollmer_G",
+        "vollmer_R",
+        "vollmer_classification",
+        "vollmer_B",
+        "vollmer_C",
+        "woodcock_Kx",
+        "woodcock_Ky",
+        "woodcock_C",
+        "woodcock_K",
+        "circular_resultant_vector",
+        "circular_mean_resultant_vector",
+        "circular_resultant_length",
+        "circular_mean_resultant_length",
+        "circular_variance",
+        "circular_standard_deviation",
+        "circular_mean_direction_axial",
+        "circular_confidence_axial",
+        "circular_mean_direction",
+        "circular_confidence",
+    )
+
+    def __init__(self, d=3, line=False, axial=False):
+        self.d, self.line, self.axial = d, line, axial
+        self.n = 0.0
+        self.resultant_vector = np.zeros(d)
+        self.tensor = np.zeros((d, d))
+        self.circular_resultant_vector = np.zeros(2)
+        self.axial_resultant_vector = np.zeros(2)
+        self.concentrated_resultant = np.zeros(d)
+        self.principal_axis = None
+
+    def update(self, data, weights=None):
+        """Adds the given direction cosines, optionally weighted."""
+        data = np.asarray(data, dtype=float)
+        weights = (
+            np.ones(data.shape[0])
+            if weights is None
+            else np.asarray(weights, dtype=float)
+        )
+        self.n += weights.sum()
+        self.resultant_vector += np.dot(weights, data)
+        self.tensor += np.dot(data.T * weights, data)
         if self.d == 3:
-            self.data_sphere = kwargs.get(
-                "data_sphere",
-                sphere(data / np.linalg.norm(data, axis=1)[:, np.newaxis]),
+            axis = self.eigen()[1][0]
+            if (
+                self.principal_axis is not None
+                and axis.dot(self.principal_axis) < 0.0
+            ):
+                axis = -axis
+            self.principal_axis = axis
+            self.concentrated_resultant += np.dot(
+                weights * np.where(axis.dot(data.T) < 0.0, 1, -1), data
+            )
+            circular_data = (
+                data[:, :2] / np.linalg.norm(data[:, :2], axis=1)[:, None]
+            )
+            finite = np.isfinite(circular_data).all(axis=1)
+            circular_data = circular_data[finite]
+            circular_weights = weights[finite]
+            if not self.line:
+                circular_data = -circular_data
+            self.circular_resultant_vector += np.dot(
+                circular_weights, circular_data
             )
-            if self.kwargs.get("line"):
-                self.data_sphere = invert(self.data_sphere)
-            if self.data_circle is None:
-                circular_data = (
-                    self.data[:, :2]
-                    / np.linalg.norm(self.data[:, :2], axis=1)[:, None]
-                )
-                circular_data = circular_data[
-                    np.isfinite(circular_data).all(axis=1)
-                ]
-                if not self.kwargs.get("line"):
-                    circular_data = -circular_data
-                self.data_circle = circle(
-                    circular_data, kwargs.get("axial", False)
-                )
         else:
-            self.data_sphere = kwargs.get(
-                "data_sphere", circle(data, kwargs.get("axial", False))
+            circular_data, circular_weights = data, weights
+        theta = np.radians(2 * circle(circular_data, self.axial))
+        self.axial_resultant_vector += np.dot(
+            circular_weights, np.array((np.cos(theta), np.sin(theta))).T
+        )
+        return self
+
+    def concentrate(self, chunks):
+        """\
+Sums the concentrated mean vector again over all the data seen, given anew
+as an iterable of (data, weights) chunks, each flipped towards the principal
+axis of the whole data, which makes it exact."""
+        if self.d != 3:
+            return self
+        self.principal_axis = axis = self.eigen()[1][0]
+        self.concentrated_resultant = np.zeros(self.d)
+        for data, weights in chunks:
+            data = np.asarray(data, dtype=float)
+            weights = (
+                np.ones(data.shape[0])
+                if weights is None
+                else np.asarray(weights, dtype=float)
             )
-            self.data_circle = (
-                self.data_circle
-                if self.data_circle is not None
-                else circle(data, kwargs.get("axial", False))
+            self.concentrated_resultant += np.dot(
+                weights * np.where(axis.dot(data.T) < 0.0, 1, -1), data
             )
-        # try:
-        if kwargs.get("calculate_statistics", True) and self.n > 1:
-            self.initialize_statistics()
-        # except ValueError:
-        #     pass
-        self._grid = None
-        self._cgrid = None
+        return self
 
-    def initialize_statistics(self):
-        self.resultant_vector = np.sum(self.data, axis=0)
-        self.mean_resultant_vector = self.resultant_vector / self.n
-        self.mean_vector = self.resultant_vector / np.linalg.norm(
-            self.resultant_vector
+    def eigen(self):
+        """\
+Returns the eigenvalues and eigenvectors (as rows) of the orientation tensor,
+sorted from the largest eigenvalue."""
+        eigenvalues, eigenvectors = np.linalg.eigh(self.tensor / self.n)
+        eigenvalues_order = (-eigenvalues).argsort()
+        return (
+            eigenvalues[eigenvalues_order],
+            eigenvectors[:, eigenvalues_order].T,
         )
-        self.resultant_length = np.linalg.norm(self.resultant_vector)
-        self.mean_resultant_length = self.resultant_length / self.n
 
-        if self.d == 3:
-            self.resultant_vector_sphere = sphere(self.resultant_vector)
-            self.fisher_k = (self.n - 1) / (
-                self.n - np.linalg.norm(self.resultant_vector)
-            )
-            direction_tensor = np.dot(self.data.T, self.data) / self.n
-            eigenvalues, eigenvectors = np.linalg.eigh(direction_tensor)
-            eigenvalues_order = (-eigenvalues).argsort()
+    def statistics(self):
+        """\
+Returns the statistics of the data added so far, by the name of the
+attribute of DirectionalData that holds each of them."""
+        n = self.n
+        stats = {}
+        stats["resultant_vector"] = resultant_vector = (
+            self.resultant_vector.copy()
+        )
+        stats["mean_resultant_vector"] = resultant_vector / n
+        stats["mean_vector"] = resultant_vector / np.linalg.norm(
+            resultant_vector
+        )
+        stats["resultant_length"] = np.linalg.norm(resultant_vector)
+        stats["mean_resultant_length"] = stats["resultant_length"] / n
 
-            self.eigenvalues = eigenvalues[eigenvalues_order]
-            self.eigenvectors = eigenvectors[:, eigenvalues_order].T
-            self.eigenvectors_sphere = sphere_lines(self.eigenvectors)
-            self.concentrated_mean_vector = np.mean(
-                self.data
-                * np.where(self.eigenvectors[0].dot(self.data.T) < 0.0, 1, -1)[
-                    :, None
-                ],
-                axis=0,
+        if self.d == 3:
+            stats["resultant_vector_sphere"] = sphere(resultant_vector)
+            stats["fisher_k"] = (n - 1) / (
+                n - np.linalg.norm(resultant_vector)
             )
-            self.concentrated_mean_vector /= np.linalg.norm(
-                self.concentrated_mean_vector
+            eigenvalues, eigenvectors = self.eigen()
+            stats["eigenvalues"] = eigenvalues
+            stats["eigenvectors"] = eigenvectors
+            stats["eigenvectors_sphere"] = sphere_lines(eigenvectors)
+            concentrated_mean_vector = self.concentrated_resultant / n
+            if eigenvectors[0].dot(self.principal_axis) < 0.0:
+                concentrated_mean_vector = -concentrated_mean_vector
+            stats["concentrated_mean_vector"] = (
+                concentrated_mean_vector
+                / np.linalg.norm(concentrated_mean_vector)
             )
 
             # From Vollmer 1990
-            self.vollmer_P = (
-                self.eigenvalues[0] - self.eigenvalues[1]
-            ) / eigenvalues.sum()
-            self.vollmer_G = (
-                2
-                * (self.eigenvalues[1] - self.eigenvalues[2])
-                / eigenvalues.sum()
-            )
-            self.vollmer_R = 3 * self.eigenvalues[2] / eigenvalues.sum()
-
-            self.vollmer_classification = ("point", "girdle", "random")[
-                np.argmax((self.vollmer_P, self.vollmer_G, self.vollmer_R))
+            vollmer_P = (eigenvalues[0] - eigenvalues[1]) / eigenvalues.sum()
+            vollmer_G = (
+                2 * (eigenvalues[1] - eigenvalues[2]) / eigenvalues.sum()
+            )
+            vollmer_R = 3 * eigenvalues[2] / eigenvalues.sum()
+            stats["vollmer_P"] = vollmer_P
+            stats["vollmer_G"] = vollmer_G
+            stats["vollmer_R"] = vollmer_R
+            stats["vollmer_classification"] = ("point", "girdle", "random")[
+                np.argmax((vollmer_P, vollmer_G, vollmer_R))
             ]
+            stats["vollmer_B"] = vollmer_P + vollmer_G
+            stats["vollmer_C"] = math.log(eigenvalues[0] / eigenvalues[2])
+
+            # From Woodcock 1977
+            stats["woodcock_Kx"] = math.log(eigenvalues[1] / eigenvalues[2])
+            stats["woodcock_Ky"] = math.log(eigenvalues[0] / eigenvalues[1])
+            stats["woodcock_C"] = math.log(eigenvalues[0] / eigenvalues[2])
+            stats["woodcock_K"] = (
+                stats["woodcock_Ky"] / stats["woodcock_Kx"]
+            )
 
-            self.vollmer_B = self.vollmer_P + self.vollmer_G
-            self.vollmer_C = math.log(
-                self.eigenvalues[0] / self.eigenvalues[2]
+            circular_resultant_vector = self.circular_resultant_vector.copy()
+            stats["circular_resultant_vector"] = circular_resultant_vector
+            stats["circular_mean_resultant_vector"] = (
+                circular_resultant_vector / n
+            )
+            stats["circular_resultant_length"] = np.linalg.norm(
+                circular_resultant_vector
+            )
+            stats["circular_mean_resultant_length"] = (
+                stats["circular_resultant_length"] / n
+            )
+        else:
+            circular_resultant_vector = resultant_vector
+            stats["circular_resultant_vector"] = resultant_vector
+            stats["circular_mean_resultant_vector"] = (
+                stats["mean_resultant_vector"]
+            )
+            stats["circular_resultant_length"] = stats["resultant_length"]
+            stats["circular_mean_resultant_length"] = (
+                stats["mean_resultant_length"]
             )
 
-            # From Woodcock 1977
-            self.woodcock_Kx = math.log(
-                self.eigenvalues[1] / self.eigenvalues[2]
+        stats["circular_variance"] = 1 - stats["mean_resultant_length"]
+        stats["circular_standard_deviation"] = math.sqrt(
+            -2 * math.log(1 - stats["circular_variance"])
+        )
+        (
+            stats["circular_mean_direction_axial"],
+            stats["circular_confidence_axial"],
+        ) = circular_confidence(self.axial_resultant_vector, n, axial=True)
+        (
+            stats["circular_mean_direction"],
+            stats["circular_confidence"],
+        ) = circular_confidence(circular_resultant_vector, n)
+        return stats
+
+
+def _segment_sums(values, starts, sizes):
+    # np.add.reduceat gives a row, not zero, for empty segments
+    sums = np.zeros((len(starts),) + values.shape[1:])
+    filled = sizes > 0
+    if filled.any():
+        sums[filled] = np.add.reduceat(values, starts[filled], axis=0)
+    return sums
+
+
+def batch_statistics(data, groups=None, weights=None, line=False):
+    """\
+Calculates the statistics of many datasets at once, given either as a
+sequence of direction cosine arrays or as a single array with the group of
+each row in groups. The sums of every group are reduced over the rows
+sorted by group, and their orientation tensors decomposed in a single call.
+Returns a StatisticsTable with a row per group (in the order of the
+sequence, or of the sorted group labels): the group labels, the number of
+data lines (n), their total_weight and each statistic shown by DirectionalData
+under the name of its attribute."""
+    if groups is None:
+        data = [np.asarray(group, dtype=float) for group in data]
+        sizes = np.array([group.shape[0] for group in data], dtype=int)
+        labels = np.arange(len(data))
+        data = np.concatenate(data) if data else np.zeros((0, 3))
+        if weights is not None:
+            weights = np.concatenate(
+                [np.asarray(group, dtype=float) for group in weights]
+            )
+    else:
+        labels, inverse = np.unique(groups, return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        data = np.asarray(data, dtype=float)[order]
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float)[order]
+        sizes = np.bincount(inverse, minlength=len(labels))
+    starts = np.cumsum(sizes) - sizes
+    d = data.shape[1]
+    weights = np.ones(data.shape[0]) if weights is None else weights
+    if d == 3:
+        circular_data = (
+            data[:, :2] / np.linalg.norm(data[:, :2], axis=1)[:, None]
+        )
+        circular_data = np.where(
+            np.isfinite(circular_data), circular_data, 0.0
+        )
+        if not line:
+            circular_data = -circular_data
+    else:
+        circular_data = data
+    theta = np.radians(2 * circle(circular_data))
+    doubled = np.array((np.cos(theta), np.sin(theta))).T * (
+        circular_data != 0.0
+    ).any(axis=1)[:, None]
+    table = np.hstack(
+        (
+            weights[:, None],
+            data * weights[:, None],
+            circular_data * weights[:, None],
+            doubled * weights[:, None],
+            (data[:, :, None] * data[:, None, :]).reshape(-1, d * d)
+            * weights[:, None],
+        )
+    )
+    sums = _segment_sums(table, starts, sizes)
+    n = sums[:, 0]
+    resultant_vector = sums[:, 1 : d + 1]
+    circular_resultant_vector = sums[:, d + 1 : d + 3]
+    axial_resultant_vector = sums[:, d + 3 : d + 5]
+    tensor = sums[:, d + 5 :].reshape(-1, d, d)
+
+    columns = OrderedDict()
+    columns["group"] = labels
+    columns["n"] = sizes
+    columns["total_weight"] = n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        resultant_length = np.linalg.norm(resultant_vector, axis=1)
+        columns["resultant_vector"] = resultant_vector
+        columns["mean_resultant_vector"] = resultant_vector / n[:, None]
+        columns["mean_vector"] = (
+            resultant_vector / resultant_length[:, None]
+        )
+        columns["resultant_length"] = resultant_length
+        columns["mean_resultant_length"] = mean_resultant_length = (
+            resultant_length / n
+        )
+        if d == 3:
+            columns["resultant_vector_sphere"] = sphere(resultant_vector)
+            columns["fisher_k"] = (n - 1) / (n - resultant_length)
+            direction_tensor = tensor / n[:, None, None]
+            # groups without data get no eigenvectors
+            defined = np.isfinite(direction_tensor).all(axis=(1, 2))
+            direction_tensor[~defined] = 0.0
+            eigenvalues, eigenvectors = np.linalg.eigh(direction_tensor)
+            eigenvalues = eigenvalues[:, ::-1]
+            eigenvectors = np.transpose(eigenvectors[:, :, ::-1], (0, 2, 1))
+            eigenvalues[~defined] = np.nan
+            eigenvectors[~defined] = np.nan
+            columns["eigenvalues"] = eigenvalues
+            columns["eigenvectors"] = eigenvectors
+            columns["eigenvectors_sphere"] = sphere_lines(
+                eigenvectors.reshape(-1, 3)
+            ).reshape(-1, 3, 2)
+            # a second pass, flipping each datum against its principal axis
+            axis = np.repeat(eigenvectors[:, 0], sizes, axis=0)
+            flip = np.where((axis * data).sum(axis=1) < 0.0, 1, -1)
+            concentrated_mean_vector = _segment_sums(
+                data * (weights * flip)[:, None], starts, sizes
+            )
+            columns["concentrated_mean_vector"] = (
+                concentrated_mean_vector
+                / np.linalg.norm(concentrated_mean_vector, axis=1)[:, None]
+            )
+            S1, S2, S3 = eigenvalues.T
+            total = eigenvalues.sum(axis=1)
+            columns["vollmer_P"] = vollmer_P = (S1 - S2) / total
+            columns["vollmer_G"] = vollmer_G = 2 * (S2 - S3) / total
+            columns["vollmer_R"] = vollmer_R = 3 * S3 / total
+            classification = np.argmax(
+                (vollmer_P, vollmer_G, vollmer_R), axis=0
+            )
+            # groups without data (or weight) have no shape
+            classification[~np.isfinite(vollmer_P)] = 3
+            columns["vollmer_classification"] = np.array(
+                ("point", "girdle", "random", "undefined")
+            )[classification]
+            columns["vollmer_B"] = vollmer_P + vollmer_G
+            columns["vollmer_C"] = np.log(S1 / S3)
+            columns["woodcock_Kx"] = woodcock_Kx = np.log(S2 / S3)
+            columns["woodcock_Ky"] = woodcock_Ky = np.log(S1 / S2)
+            columns["woodcock_C"] = np.log(S1 / S3)
+            columns["woodcock_K"] = woodcock_Ky / woodcock_Kx
+            columns["circular_resultant_vector"] = circular_resultant_vector
+            circular_resultant_length = np.linalg.norm(
+                circular_resultant_vector, axis=1
+            )
+            columns["circular_mean_resultant_vector"] = (
+                circular_resultant_vector / n[:, None]
+            )
+            columns["circular_resultant_length"] = circular_resultant_length
+            columns["circular_mean_resultant_length"] = (
+                circular_resultant_length / n
+            )
+        else:
+            circular_resultant_vector = resultant_vector
+            for name in (
+                "resultant_vector",
+                "mean_resultant_vector",
+                "resultant_length",
+                "mean_resultant_length",
+            ):
+                columns["circular_" + name] = columns[name]
+        columns["circular_variance"] = circular_variance = (
+            1 - mean_resultant_length
+        )
+        columns["circular_standard_deviation"] = np.sqrt(
+            -2 * np.log(1 - circular_variance)
+        )
+        (
+            columns["circular_mean_direction_axial"],
+            columns["circular_confidence_axial"],
+        ) = circular_confidence(axial_resultant_vector, n, axial=True)
+        (
+            columns["circular_mean_direction"],
+            columns["circular_confidence"],
+        ) = circular_confidence(circular_resultant_vector, n)
+    for name in list(columns)[3:]:
+        if columns[name].dtype.kind == "f":
+            columns[name][sizes == 0] = np.nan
+    return StatisticsTable.from_columns(columns)
+
+
+class StatisticsTable(Mapping):
+    """\
+Statistics of one or more datasets, one row each, kept in a numpy record
+array with a typed field per statistic (vectors and matrices as subarrays).
+Each field can be read by name, as a view of the records, and the table
+exported with to_records, to_json and to_csv."""
+
+    def __init__(self, records):
+        self.records = records
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Builds a table from a mapping of names to equally long columns."""
+        columns = OrderedDict(
+            (name, np.asarray(column)) for name, column in columns.items()
+        )
+        rows = len(next(iter(columns.values()))) if columns else 0
+        records = np.empty(
+            rows,
+            dtype=[
+                (name, column.dtype, column.shape[1:])
+                for name, column in columns.items()
+            ],
+        )
+        for name, column in columns.items():
+            records[name] = column
+        return cls(records)
+
+    def __getitem__(self, name):
+        return self.records[name]
+
+    def __iter__(self):
+        return iter(self.records.dtype.names or ())
+
+    def __len__(self):
+        return len(self.records.dtype.names or ())
+
+    @property
+    def rows(self):
+        return self.records.shape[0]
+
+    def to_records(self):
+        """Returns the statistics as a numpy record array, without copying."""
+        return self.records.view(np.recarray)
+
+    def to_rows(self):
+        """\
+Returns a list with a dictionary of the statistics of each row, as plain
+python values, with None for undefined (nan) values."""
+
+        def plain(value):
+            if isinstance(value, list):
+                return [plain(item) for item in value]
+            if isinstance(value, float) and not np.isfinite(value):
+                return None
+            return value
+
+        return [
+            OrderedDict(
+                (name, plain(self.records[name][row].tolist()))
+                for name in self
+            )
+            for row in range(self.rows)
+        ]
+
+    def to_json(self, fout=None, **kwargs):
+        """\
+Returns the statistics as a JSON list of objects, one per row, or writes it
+to fout, a filename or file, if given. Extra options go to json.dumps."""
+        text = json.dumps(self.to_rows(), **kwargs)
+        if fout is None:
+            return text
+        if isinstance(fout, str):
+            with open(fout, "w") as f:
+                f.write(text)
+        else:
+            fout.write(text)
+
+    def to_csv(self, fout, **kwargs):
+        """\
+Writes the statistics to fout, a filename or file, as a csv table with a
+row per dataset. Vectors and matrices are spread over a column per value,
+suffixed by their index. Extra options go to csv.writer."""
+        headers = []
+        for name in self:
+            shape = self.records.dtype[name].shape
+            headers.extend(
+                name + "".join("_{}".format(i) for i in index)
+                for index in np.ndindex(*shape)
             )
-            self.woodcock_Ky = math.log(
-                self.eigenvalues[0] / self.eigenvalues[1]
+        rows = [
+            [
+                value
+                for name in self
+                for value in np.ravel(self.records[name][row]).tolist()
+            ]
+            for row in range(self.rows)
+        ]
+        f = open(fout, "w", newline="") if isinstance(fout, str) else fout
+        try:
+            table = writer(f, **kwargs)
+            table.writerow(headers)
+            table.writerows(rows)
+        finally:
+            if isinstance(fout, str):
+                f.close()
+
+
+def accumulate_statistics(fin, chunk_size=None, **kwargs):
+    """\
+Accumulates the statistics of the data in the given file, or iterable of
+rows, loading chunk_size (statistics_chunk_size if not given) rows at a time
+so that files too large for memory can be summarised. Takes the same options
+as load and returns a SphericalAccumulator, or None if there was no data."""
+    chunk_size = statistics_chunk_size if chunk_size is None else chunk_size
+    if isinstance(fin, str) and is_dataset(fin):
+        data = load_dataset(fin, **kwargs)
+        return data.accumulate(chunk_size) if data.n else None
+    if isinstance(fin, str) or hasattr(fin, "read"):
+        # open files are loaded as their lines would be, not as text rows
+        name = fin if isinstance(fin, str) else getattr(fin, "name", "")
+        extension = kwargs.get("extension", None)
+        extension = (
+            extension
+            if extension is not None
+            else os.path.splitext(str(name))[-1]
+        )
+        fin = universal_loader(
+            fin, extension=extension, worksheet=kwargs.get("worksheet", 0)
+        )
+    if isinstance(fin, np.ndarray) and fin.ndim == 1:
+        # such as np.loadtxt returns for files of a single column
+        fin = fin.reshape(-1, 1)
+    rows = iter(fin)
+    kwargs = dict(kwargs, keep_input=False, calculate_statistics=False)
+    accumulator = None
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            return accumulator
+        data = load(chunk, **kwargs)
+        if accumulator is None:
+            accumulator = SphericalAccumulator(
+                data.d, kwargs.get("line", False), kwargs.get("axial", False)
             )
-            self.woodcock_C = math.log(
-                self.eigenvalues[0] / self.eigenvalues[2]
+        accumulator.update(data.data, data.weights)
+
+
+def _read_only(array):
+    # a read only view of array, so that it can't change while it is used
+    # (and its shared memory copy can be reused, see CountingPool.share)
+    view = array.view()
+    view.setflags(write=False)
+    return view
+
+
+class DirectionalData(object):
+    def __init__(self, data, *args, **kwargs):
+        """\
+        Base class for directional data analysis, either 2d or 3d. Store optionally
+        additional arguments for plotting. Each datum may be given a
+        weight, such as the number of times it was measured, through
+        weights. If the aggregate option is set, counting and statistics
+        work over weighted unique directions instead, merging either exact
+        duplicates (True) or directions within a resolution, in degrees
+        (see aggregate_directions). The input columns, one row per datum,
+        may be given as a ColumnTable through attributes. The data may be
+        memory mapped (see load_dataset), as it is only read when used.
+        The statistics (see SphericalAccumulator.statistics) are only
+        calculated when first used, and again if data or weights change."""
+        self.args, self.kwargs = args, kwargs
+        self._grid = None
+        self._cgrid = None
+        self._weights = None
+        self.data = data
+        self.input_data = kwargs.pop("input_data", [])
+        attributes = kwargs.pop("attributes", None)
+        self.attributes = ColumnTable([]) if attributes is None else attributes
+        weights = kwargs.pop("weights", None)
+        self.weights = (
+            np.asarray(weights, dtype=float) if weights is not None else None
+        )
+        if kwargs.get("data_circle") is not None:
+            self.data_circle = kwargs["data_circle"]
+        if kwargs.get("data_sphere") is not None:
+            self.data_sphere = kwargs["data_sphere"]
+            if self.d == 3 and self.kwargs.get("line"):
+                self.data_sphere = invert(self.data_sphere)
+
+    def __getattr__(self, name):
+        # only called for missing attributes, such as statistics not yet used
+        if (
+            name in SphericalAccumulator.names
+            and self.n > 1
+            and not vars(self).get("_statistics_initialized", False)
+        ):
+            self.initialize_statistics()
+            if name in vars(self):
+                return vars(self)[name]
+        if name == "data_sphere":
+            self.data_sphere = self.spherical_coordinates()
+            return self.data_sphere
+        if name == "data_circle":
+            self.data_circle = self.circular_coordinates()
+            return self.data_circle
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(
+                type(self).__name__, name
             )
+        )
 
-            self.woodcock_K = self.woodcock_Ky / self.woodcock_Kx
+    def spherical_coordinates(self):
+        # the data in spherical coordinates, or azimuths if circular, only
+        # calculated when first used, so that opening memory mapped data
+        # doesn't read it all
+        if self.d == 3:
+            data_sphere = sphere(
+                self.data / np.linalg.norm(self.data, axis=1)[:, np.newaxis]
+            )
+            if self.kwargs.get("line"):
+                data_sphere = invert(data_sphere)
+            return data_sphere
+        return circle(self.data, self.kwargs.get("axial", False))
 
+    def circular_coordinates(self):
+        # the azimuths of the data, as plotted on roses
+        if self.d == 3:
             circular_data = (
                 self.data[:, :2]
                 / np.linalg.norm(self.data[:, :2], axis=1)[:, None]
@@ -497,35 +1931,97 @@ class DirectionalData(object):
             ]
             if not self.kwargs.get("line"):
                 circular_data = -circular_data
-            self.circular_resultant_vector = np.sum(circular_data, axis=0)
-            self.circular_mean_resultant_vector = (
-                self.circular_resultant_vector / self.n
-            )
-            self.circular_resultant_length = np.linalg.norm(
-                self.circular_resultant_vector
-            )
-            self.circular_mean_resultant_length = (
-                self.circular_resultant_length / self.n
+            return circle(circular_data, self.kwargs.get("axial", False))
+        return circle(self.data, self.kwargs.get("axial", False))
+
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        previous_d = vars(self).get("d", None)
+        self._data = _read_only(data)
+        self.n, self.d = self._data.shape
+        # the coordinates, and the grids if the dimension changed, are only
+        # derived from the data, not from the weights
+        vars(self).pop("data_sphere", None)
+        vars(self).pop("data_circle", None)
+        if self.d != previous_d:
+            self._grid = None
+            self._cgrid = None
+        self.invalidate_statistics()
+
+    @property
+    def weights(self):
+        return self._weights
+
+    @weights.setter
+    def weights(self, weights):
+        self._weights = None if weights is None else _read_only(weights)
+        self.invalidate_statistics()
+
+    def invalidate_statistics(self):
+        """\
+Drops the statistics and everything else derived from the data and weights,
+so that they are calculated again when next used."""
+        for name in SphericalAccumulator.names:
+            vars(self).pop(name, None)
+        self._statistics_initialized = False
+        self._aggregated = None
+        self._spatial_index = None
+        if isinstance(self._grid, SphericalGrid):
+            self._grid.result = None
+            self._grid.error_bound = 0.0
+
+    @property
+    def weighted_data(self):
+        """\
+The directions and weights (None if unweighted) used for counting and
+statistics, aggregated as set by the aggregate option."""
+        aggregate = self.kwargs.get("aggregate", False)
+        if aggregate is None or aggregate is False:
+            return self.data, self.weights
+        if self._aggregated is None:
+            self._aggregated = aggregate_directions(
+                self.data,
+                self.weights,
+                None if aggregate is True else aggregate,
             )
-            # for line_s, line_c in zip(self.data, circular_data):
-            #    print(line_c, line_s)
+        return self._aggregated
 
-        else:
-            self.circular_resultant_vector = self.resultant_vector
-            self.circular_mean_resultant_vector = self.mean_resultant_vector
-            self.circular_resultant_length = self.resultant_length
-            self.circular_mean_resultant_length = self.mean_resultant_length
+    @property
+    def total_weight(self):
+        return self.n if self.weights is None else self.weights.sum()
 
-        self.circular_variance = 1 - self.mean_resultant_length
-        self.circular_standard_deviation = math.sqrt(
-            -2 * math.log(1 - self.circular_variance)
-        )
-        self.circular_mean_direction_axial, self.circular_confidence_axial = self.estimate_circular_confidence(
-            axial=True
-        )
-        self.circular_mean_direction, self.circular_confidence = self.estimate_circular_confidence(
-            axial=False
+    def initialize_statistics(self):
+        vars(self).update(self.accumulate().statistics())
+        # so that names missing from these statistics, such as those only
+        # defined for 3d data, don't calculate them again
+        self._statistics_initialized = True
+
+    def accumulate(self, chunk_size=None):
+        """\
+Returns a SphericalAccumulator of the weighted data, summed chunk_size
+(statistics_chunk_size if not given) data at a time, so that memory mapped
+data (see load_dataset) needn't fit in memory."""
+        size = statistics_chunk_size if chunk_size is None else chunk_size
+        data, weights = self.weighted_data
+        accumulator = SphericalAccumulator(
+            self.d, self.kwargs.get("line"), self.kwargs.get("axial", False)
         )
+        chunks = [
+            (
+                data[start : start + size],
+                None if weights is None else weights[start : start + size],
+            )
+            for start in range(0, len(data), size)
+        ]
+        for chunk_data, chunk_weights in chunks:
+            accumulator.update(chunk_data, chunk_weights)
+        if len(chunks) > 1:
+            accumulator.concentrate(chunks)
+        return accumulator
 
     def __add__(self, other):
         """Concatenate A and B directional datasets, retaining A's additional attributes"""
@@ -536,50 +2032,150 @@ class DirectionalData(object):
         return intersect(self, other)
 
     def estimate_khat(self, R_):
-        n = self.n
-        if R_ < 0.53:
-            K_ = 2.0 * R_ + (R_ ** 3.0) + (5 * (R_ ** 5.0) / 6.0)
-        elif 0.53 <= R_ <= 0.85:
-            K_ = -0.4 + 1.39 * R_ + 0.43 / (1.0 - R_)
-        else:  # R_ > 0.85:
-            K_ = 1.0 / (R_ ** 3.0 - 4.0 * (R_ ** 2.0) + 3.0 * R_)
-        if (
-            (0.4 <= K_ < 1.0 and n >= 25)
-            or (1.0 <= K_ < 1.5 and n >= 15)
-            or (1.5 <= K_ < 2.0 and n >= 10)
-            or K_ >= 2.0
-        ):
-            K_ = (
-                max(K_ - 2.0 / (n * K_), 0.0)
-                if K_ < 2.0
-                else ((n - 1) ** 3) * K_ / (n + n ** 3)
+        return estimate_khat(R_, self.total_weight)
+
+    @property
+    def weighted_circle(self):
+        """\
+The azimuths of the weighted data, as in data_circle, and their weights
+(None if unweighted)."""
+        data, weights = self.weighted_data
+        if data is self.data and weights is None:
+            return self.data_circle, None
+        if self.d == 3:
+            circular_data = (
+                data[:, :2] / np.linalg.norm(data[:, :2], axis=1)[:, None]
             )
-        return K_
+            finite = np.isfinite(circular_data).all(axis=1)
+            circular_data = circular_data[finite]
+            if weights is not None:
+                weights = weights[finite]
+            if not self.kwargs.get("line"):
+                circular_data = -circular_data
+        else:
+            circular_data = data
+        return circle(circular_data, self.kwargs.get("axial", False)), weights
 
     def estimate_circular_confidence(self, axial=False, alpha=0.95):
+        n = self.total_weight
         if axial:
-            theta = 2 * self.data_circle
+            angles, weights = self.weighted_circle
+            theta = 2 * angles
             dcos = np.array(
                 (np.cos(np.radians(theta)), np.sin(np.radians(theta)))
             ).T
-            mean = dcos.sum(axis=0)
-            theta_ = circle(mean)
-            R_ = np.linalg.norm(mean) / self.n
+            mean = (
+                dcos.sum(axis=0) if weights is None else np.dot(weights, dcos)
+            )
+            return circular_confidence(mean, n, True, alpha)
+        return circular_confidence(
+            self.circular_resultant_vector, n, False, alpha
+        )
+
+    def bootstrap_confidence(
+        self, alpha=0.95, resamples=None, seed=None, multicore=None
+    ):
+        """\
+Estimates confidence intervals by resampling the data (see bootstrap),
+each datum drawn with a probability proportional to its weight. Returns a
+dictionary of (estimate, interval) pairs, where the interval is the
+half-width, in degrees, of the circular means (circular_mean and, for axial
+data, circular_mean_axial) and the opening, in degrees, of the cones
+around the mean_vector and each of the eigenvectors, or the lower and upper
+bounds of fisher_k. Unlike estimate_circular_confidence, these are defined
+for data of any dispersion."""
+        data, weights = self.weighted_data
+        m = data.shape[0]
+        weights = np.ones(m) if weights is None else weights
+        total = weights.sum()
+        if self.d == 3:
+            circular = data[:, :2] / np.linalg.norm(data[:, :2], axis=1)[
+                :, None
+            ]
+            circular = np.where(np.isfinite(circular), circular, 0.0)
+            if not self.kwargs.get("line"):
+                circular = -circular
         else:
-            R_ = self.circular_mean_resultant_length
-            theta_ = circle(self.circular_resultant_vector)
-        if axial:
-            theta = theta / 2.0
-        K_ = self.estimate_khat(R_)
-        z = ndtri(alpha)
-        sigma = 1.0 / sqrt(self.n * R_ * K_)
-        try:
-            i = degrees(asin(z * sigma))
+            circular = data
+        azimuths = np.arctan2(circular[:, 0], circular[:, 1])
+        doubled = np.array(
+            (np.sin(2 * azimuths), np.cos(2 * azimuths))
+        ).T * np.linalg.norm(circular, axis=1)[:, None]
+        columns = [data, circular, doubled]
+        if self.d == 3:
+            columns.append((data[:, :, None] * data[:, None, :]).reshape(m, 9))
+        table = np.hstack(columns)
+        sums = bootstrap(
+            table,
+            self.n,
+            weights / total,
+            total / self.n,
+            resamples,
+            seed,
+            multicore,
+        )
+        sample = np.dot(weights, table)
+        d = self.d
+        lower, upper = (1.0 - alpha) / 2.0, (1.0 + alpha) / 2.0
+
+        def cone(vectors, estimate, axial=False):
+            vectors = vectors / np.linalg.norm(vectors, axis=-1)[..., None]
+            cosines = np.dot(vectors, estimate / np.linalg.norm(estimate))
             if axial:
-                i = i / 2.0
-        except ValueError:
-            i = None
-        return theta_, i
+                cosines = np.abs(cosines)
+            return degrees(
+                np.quantile(np.arccos(np.clip(cosines, -1.0, 1.0)), alpha)
+            )
+
+        def circular_mean(sums, sample, period=360.0):
+            estimate = circle(sample) * period / 360.0
+            means = circle(sums) * period / 360.0
+            deviation = (means - estimate + period / 2) % period - period / 2
+            return estimate, np.quantile(np.abs(deviation), alpha)
+
+        result = {
+            "mean_vector": (
+                sample[:d] / np.linalg.norm(sample[:d]),
+                cone(sums[:, :d], sample[:d]),
+            ),
+            "circular_mean": circular_mean(
+                sums[:, d : d + 2], sample[d : d + 2]
+            ),
+            "circular_mean_axial": circular_mean(
+                sums[:, d + 2 : d + 4], sample[d + 2 : d + 4], 180.0
+            ),
+        }
+        if d == 3:
+            def fisher_k(resultants):
+                # resamples of coincident data have a resultant as long as
+                # their weight, and so an unbounded, but not negative, k
+                spread = np.maximum(
+                    total - resultants, total * np.finfo(float).eps
+                )
+                return np.maximum(total - 1.0, 0.0) / spread
+
+            result["fisher_k"] = (
+                fisher_k(np.linalg.norm(sample[:3])),
+                tuple(
+                    np.nanquantile(
+                        fisher_k(np.linalg.norm(sums[:, :3], axis=1)),
+                        (lower, upper),
+                    )
+                ),
+            )
+            eigenvectors = np.linalg.eigh(sums[:, 7:].reshape(-1, 3, 3))[1]
+            estimate = np.linalg.eigh(sample[7:].reshape(3, 3))[1]
+            # eigh sorts ascending, the eigenvectors are sorted descending
+            result["eigenvectors"] = (
+                estimate[:, ::-1].T,
+                np.array(
+                    [
+                        cone(eigenvectors[:, :, i], estimate[:, i], True)
+                        for i in (2, 1, 0)
+                    ]
+                ),
+            )
+        return result
 
     @property
     def grid(self):
@@ -591,12 +2187,25 @@ class DirectionalData(object):
             )
         return self._grid
 
+    @grid.setter
+    def grid(self, grid):
+        """\
+Sets the counting grid, such as the grid of a previous version of this
+data, so that counting it again only counts the rows that changed."""
+        self._grid = grid
+
     @property
     def cgrid(self):
         if self._cgrid is None:
             self._cgrid = CircularGrid(**self.kwargs)
         return self._cgrid
 
+    @property
+    def spatial_index(self):
+        if self._spatial_index is None:
+            self._spatial_index = SphericalIndex(*self.weighted_data)
+        return self._spatial_index
+
     @property
     def grid_nodes(self):
         return self.grid.grid
@@ -607,6 +2216,20 @@ class DirectionalData(object):
     def grid_kamb(self, theta=None):
         return self.grid.count_kamb(self, theta)
 
+    def grid_fisher_truncated(self, k=None, tolerance=None):
+        return self.grid.count_fisher_truncated(self, k, tolerance)
+
+    def rose_data(self, data_weight=None):
+        """\
+Returns the data and weights to count on a rose diagram: the weighted data,
+unless a weight is given for each of the original data."""
+        if data_weight is None:
+            return self.weighted_data
+        data_weight = np.asarray(data_weight, dtype=float)
+        if self.weights is not None:
+            data_weight = data_weight * self.weights
+        return self.data, data_weight
+
     def grid_rose(
         self,
         aperture=10.0,
@@ -617,16 +2240,15 @@ class DirectionalData(object):
         direction=False,
         nodes=None,
     ):
+        weighted_input = data_weight is not None
+        data, data_weight = self.rose_data(data_weight)
         if self.d == 2:
             circular_data = (
-                self.data
-                if data_weight is None
-                else self.data * data_weight[:, None]
+                data * data_weight[:, None] if weighted_input else data
             )
         else:
             circular_data = (
-                self.data[:, :2]
-                / np.linalg.norm(self.data[:, :2], axis=1)[:, None]
+                data[:, :2] / np.linalg.norm(data[:, :2], axis=1)[:, None]
             )
             if not self.kwargs.get("line"):
                 circular_data = -circular_data
@@ -656,12 +2278,12 @@ class DirectionalData(object):
         direction=False,
         nodes=None,
     ):
+        data, data_weight = self.rose_data(data_weight)
         if self.d == 2:
-            circular_data = self.data
+            circular_data = data
         else:
             circular_data = (
-                self.data[:, :2]
-                / np.linalg.norm(self.data[:, :2], axis=1)[:, None]
+                data[:, :2] / np.linalg.norm(data[:, :2], axis=1)[:, None]
             )
             if not self.kwargs.get("line"):
                 circular_data = -circular_data
@@ -788,6 +2410,22 @@ Spherical Mode:
                 )
         return statistics
 
+    def statistics_table(self):
+        """\
+Returns the statistics of this dataset as a single row StatisticsTable,
+with its spherical mode if the grid was counted."""
+        columns = OrderedDict(
+            (("n", [self.n]), ("total_weight", [self.total_weight]))
+        )
+        for name in SphericalAccumulator.names:
+            if hasattr(self, name):
+                value = getattr(self, name)
+                # such as a circular confidence that couldn't be estimated
+                columns[name] = [np.nan if value is None else value]
+        if self.d == 3 and self.grid.result is not None:
+            columns["mode_sphere"] = [self.mode_sphere]
+        return StatisticsTable.from_columns(columns)
+
     @property
     def statistics(self):
         try:
@@ -803,48 +2441,235 @@ Statistics couldn't be calculated."""
         )
 
 
-class PartProcessor(multiprocessing.Process):
-    def run(self):
-        connection = self._kwargs.pop("connection")
-        connection.send(self._target(*self._args, **self._kwargs))
-        connection.close()
+def _attach_shared_memory(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # track was only added on python 3.13
+        block = shared_memory.SharedMemory(name=name)
+        if os.name == "posix":
+            # the creating process owns the block, so keep the resource
+            # tracker from unlinking it when this worker exits.
+            resource_tracker.unregister(block._name, "shared_memory")
+        return block
+
+
+# shared blocks attached by this (worker) process, by name.
+_attached_arrays = OrderedDict()
+
+
+def _attach_array(descriptor):
+    name, shape, dtype = descriptor
+    if name not in _attached_arrays:
+        while len(_attached_arrays) >= CountingPool.max_shared:
+            old_block, old_array = _attached_arrays.popitem(last=False)[1]
+            del old_array
+            old_block.close()
+        block = _attach_shared_memory(name)
+        array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        _attached_arrays[name] = (block, array)
+    return _attached_arrays[name][1]
+
+
+class _SharedArgument(object):
+    # an array argument of a counting function sent as a shared memory copy
+    def __init__(self, descriptor):
+        self.descriptor = descriptor
+
+
+def _attach_argument(argument):
+    if isinstance(argument, _SharedArgument):
+        return _attach_array(argument.descriptor)
+    return argument
+
+
+def _count_section(
+    function, grid, direction_cosines, start, stop, args, kwargs
+):
+    return function(
+        _attach_array(grid)[start:stop],
+        _attach_array(direction_cosines),
+        *[_attach_argument(argument) for argument in args],
+        **{key: _attach_argument(value) for key, value in kwargs.items()}
+    )
+
+
+class CountingPool(object):
+    """\
+A persistent pool of worker processes for grid counting. Arrays (the grid,
+the data and array arguments such as weights) are copied into shared memory
+and the workers attach to them by name, so only the row ranges and the
+(small) counting function are sent on each call. Read only arrays, such as
+the registered grids and the data of DirectionalData, are only copied the
+first time they are shared."""
+
+    max_shared = 8
+
+    def __init__(self, processes=None):
+        self.processes = processes if processes is not None else cpu_count()
+        self.pool = multiprocessing.Pool(self.processes)
+        self.shared = OrderedDict()
+
+    def share(self, array, token=None):
+        """\
+Returns a descriptor of a shared memory copy of array. The copy is reused
+for the same array if it was shared with the same token before, or without
+a token, if it is read only (so it can't have changed since). Only a weak
+reference to the array is kept, to tell whether it is still the same."""
+        array = np.asarray(array)
+        key = id(array) if token is None else token
+        if key in self.shared:
+            reference, block, shared_array = self.shared[key]
+            if reference() is array and (
+                token is not None or not array.flags.writeable
+            ):
+                self.shared.move_to_end(key)
+                return block.name, shared_array.shape, shared_array.dtype.str
+            self.unlink(key)
+        while len(self.shared) >= self.max_shared:
+            self.unlink(next(iter(self.shared)))
+        block = shared_memory.SharedMemory(
+            create=True, size=max(array.nbytes, 1)
+        )
+        shared_array = np.ndarray(array.shape, array.dtype, buffer=block.buf)
+        shared_array[...] = array
+        self.shared[key] = (_reference(array), block, shared_array)
+        return block.name, shared_array.shape, shared_array.dtype.str
+
+    def unlink(self, key):
+        reference, block, shared_array = self.shared.pop(key)
+        del shared_array
+        block.close()
+        block.unlink()
+
+    def count(self, function, grid, direction_cosines, *args, **kwargs):
+        """\
+Evaluates function over the grid, splitting its rows evenly among the worker
+processes, and joins the results."""
+        grid_descriptor = self.share(grid)
+        data_descriptor = self.share(direction_cosines)
+        args = [self.share_argument(argument) for argument in args]
+        kwargs = {
+            key: self.share_argument(value) for key, value in kwargs.items()
+        }
+        bounds = np.linspace(0, grid.shape[0], self.processes + 1).astype(int)
+        sections = [
+            (
+                function,
+                grid_descriptor,
+                data_descriptor,
+                start,
+                stop,
+                args,
+                kwargs,
+            )
+            for start, stop in zip(bounds[:-1], bounds[1:])
+            if stop > start
+        ]
+        return np.concatenate(self.pool.starmap(_count_section, sections))
+
+    def share_argument(self, argument):
+        # array arguments, such as weights, are sent as shared memory too
+        if isinstance(argument, np.ndarray) and argument.ndim > 0:
+            return _SharedArgument(self.share(argument))
+        return argument
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
+        while self.shared:
+            self.unlink(next(iter(self.shared)))
+
+
+def _reference(array):
+    # a weak reference to array, or a function returning None if it can't be
+    # referenced weakly, so that its shared copy is never reused
+    try:
+        return weakref.ref(array)
+    except TypeError:
+        return lambda: None
+
+
+_counting_pool = None
+
+
+def counting_pool():
+    """Returns the process-wide CountingPool, starting it on first use."""
+    global _counting_pool
+    if _counting_pool is None:
+        _counting_pool = CountingPool()
+        atexit.register(_counting_pool.close)
+    return _counting_pool
+
+
+def _bootstrap_batch(seed, resamples, size, probabilities, table, scale):
+    counts = np.random.default_rng(seed).multinomial(
+        size, probabilities, size=resamples
+    )
+    return np.dot(counts, table) * scale
+
+
+def bootstrap(
+    table,
+    size,
+    probabilities=None,
+    scale=1.0,
+    resamples=None,
+    seed=None,
+    multicore=None,
+):
+    """\
+Draws resamples (bootstrap_resamples if not given) of size rows of table,
+with replacement and each row with the given probability, returning the sum
+of the drawn rows times scale for each resample. They are drawn in batches,
+each from its own child of SeedSequence(seed), so that the result for a
+given seed is the same whether or not the batches are spread among the
+worker processes of the CountingPool (multicore_when_possible if multicore
+is not given)."""
+    table = np.asarray(table, dtype=float)
+    m = table.shape[0]
+    probabilities = (
+        np.full(m, 1.0 / m) if probabilities is None else probabilities
+    )
+    resamples = bootstrap_resamples if resamples is None else resamples
+    multicore = multicore_when_possible if multicore is None else multicore
+    # the resample counts of a batch are kept within the counting memory
+    batch = max(1, min(bootstrap_batch, counting_memory_limit // (8 * m)))
+    sizes = [batch] * (resamples // batch)
+    if resamples % batch:
+        sizes.append(resamples % batch)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [
+        (batch_seed, batch_size, size, probabilities, table, scale)
+        for batch_seed, batch_size in zip(seeds, sizes)
+    ]
+    if multicore and len(tasks) > 1 and cpu_count() > 1:
+        results = counting_pool().pool.starmap(_bootstrap_batch, tasks)
+    else:
+        results = [_bootstrap_batch(*task) for task in tasks]
+    return np.concatenate(results)
 
 
 def parallel(function):
     """\
 A parallelization decorator for simple functions that evaluate over a grid,
-splitting it's first dimension among the available cores."""
+splitting it's first dimension among the available cores. The function must
+be picklable (a module level function or a KernelCounter, for example), as
+it is run on the worker processes of the CountingPool. Problems smaller than
+parallel_threshold grid x data pairs are evaluated on the calling process."""
     core_count = cpu_count()
-    if core_count < 2:
+    if core_count < 2 or shared_memory is None:
+        return function
+    try:
+        pickle.dumps(function)
+    except (pickle.PicklingError, AttributeError, TypeError):
         return function
 
-    def parallel_function(grid, *args, **kwargs):
-        output = []
-        cores = []
-        grid_size = grid.shape[0]
-        grid_section = int(grid_size / core_count)
-        for n in range(core_count - 1):
-            server_p, client_p = Pipe()
-            core = PartProcessor(
-                grid[n * grid_section : (n + 1) * grid_section, :],
-                target=function,
-                *args,
-                **kwargs
-            )
-            core.start()
-            cores.append(core)
-        core = PartProcessor(
-            grid[(core_count - 1) * grid_section : -1, :],
-            target=function,
-            *args,
-            **kwargs
-        )
-        core.start()
-        cores.append(core)
-        for core in cores:
-            output.append(core.recv())
-            core.close()
-        return np.vstack(output)
+    def parallel_function(grid, direction_cosines, *args, **kwargs):
+        if grid.shape[0] * direction_cosines.shape[0] < parallel_threshold:
+            return function(grid, direction_cosines, *args, **kwargs)
+        return counting_pool().count(
+            function, grid, direction_cosines, *args, **kwargs
+        )
 
     return parallel_function
 
@@ -863,190 +2688,821 @@ the decorated factory. See parallel for more details."""
     return parallel_counter_factory
 
 
+def block_count(
+    kernel,
+    grid,
+    direction_cosines,
+    memory_limit=None,
+    weights=None,
+    precision=None,
+):
+    """\
+Evaluates kernel over the cosines between the grid nodes and the data, summing
+the result, weighted by weights if given, for each node. The data is processed
+in tiles sized so that the intermediate arrays stay below memory_limit bytes
+(counting_memory_limit if not given), so each tile is still a single matrix
+product. The cosines and the kernel are computed in precision (a numpy float
+type, counting_precision if not given), but summed in double."""
+    memory_limit = (
+        counting_memory_limit if memory_limit is None else memory_limit
+    )
+    precision = np.dtype(
+        counting_precision if precision is None else precision
+    )
+    grid = np.asarray(grid, dtype=precision)
+    direction_cosines = np.asarray(direction_cosines)
+    grid_size, n = grid.shape[0], direction_cosines.shape[0]
+    # the cosine tile and one temporary of the same size from the kernel,
+    # plus the kernel in double to be weighted, if computed in less
+    tile_bytes = 2 * precision.itemsize
+    if weights is not None and precision != np.float64:
+        tile_bytes += np.dtype(np.float64).itemsize
+    tile_size = max(1, int(memory_limit // (tile_bytes * max(grid_size, 1))))
+    result = np.zeros(grid_size)
+    for start in range(0, n, tile_size):
+        tile = direction_cosines[start : start + tile_size]
+        tile = np.dot(grid, tile.astype(precision, copy=False).T)
+        if weights is None:
+            result += kernel(tile).sum(axis=1, dtype=np.float64)
+        else:
+            tile_weights = weights[start : start + tile_size]
+            result += np.dot(
+                kernel(tile).astype(np.float64, copy=False),
+                tile_weights.astype(np.float64, copy=False),
+            )
+    return result
+
+
+# Kernels receive the grid x data cosine tile, which they are free to modify
+# in place, and return the contribution of each data point to each node.
+def fisher_kernel(cosines, k):
+    cosines -= 1.0
+    cosines *= k
+    if cosines.dtype == np.float32:
+        # exp is subnormal, and slow, below this in single precision, while
+        # the error of clamping (1.6e-38 per datum) is far below its epsilon
+        np.maximum(cosines, -87.0, out=cosines)
+    return np.exp(cosines, out=cosines)
+
+
+def fisher_axial_kernel(cosines, k):
+    np.abs(cosines, out=cosines)
+    return fisher_kernel(cosines, k)
+
+
+def robin_girdle_kernel(cosines, k):
+    np.square(cosines, out=cosines)
+    cosines *= k
+    return np.exp(cosines, out=cosines)
+
+
+def kamb_kernel(cosines, theta):
+    return np.abs(cosines, out=cosines) >= theta
+
+
+class KernelCounter(object):
+    """\
+Counts data over a grid by summing one of the kernels above with block_count.
+Unlike a closure, instances can be pickled and sent to the CountingPool."""
+
+    def __init__(self, kernel, memory_limit=None, precision=None):
+        self.kernel = kernel
+        self.memory_limit = memory_limit
+        self.precision = precision
+
+    def __call__(self, grid, direction_cosines, weights=None):
+        return block_count(
+            self.kernel,
+            grid,
+            direction_cosines,
+            self.memory_limit,
+            weights,
+            self.precision,
+        )
+
+
 @parallel_counter
-def FisherCounter(k):
+def FisherCounter(k, memory_limit=None, precision=None):
     try:
         from grid_functions.fisher_counter import count
 
-        def counter(grid, direction_cosines):
+        def counter(grid, direction_cosines, weights=None):
+            if weights is not None:  # the compiled counters are unweighted
+                return block_count(
+                    partial(fisher_kernel, k=k),
+                    grid,
+                    direction_cosines,
+                    memory_limit,
+                    weights,
+                    precision,
+                )
             return count(grid, direction_cosines, k)
 
     except ImportError:
-
-        def counter(grid, direction_cosines):
-            try:
-                return np.exp(k * (np.dot(grid, direction_cosines.T) - 1)).sum(
-                    axis=1
-                )
-            except MemoryError:
-                result = np.zeros((grid.shape[0], 1))
-                for input_node, output_node in zip(grid, result):
-                    output_node[:] = np.exp(
-                        k * (np.dot(input_node, direction_cosines.T) - 1)
-                    ).sum()
+        counter = KernelCounter(
+            partial(fisher_kernel, k=k), memory_limit, precision
+        )
 
     return counter
 
 
 @parallel_counter
-def FisherCounterAxial(k):
+def FisherCounterAxial(k, memory_limit=None, precision=None):
     try:
         from grid_functions.fisher_counter_axial import count
 
-        def counter(grid, direction_cosines):
+        def counter(grid, direction_cosines, weights=None):
+            if weights is not None:  # the compiled counters are unweighted
+                return block_count(
+                    partial(fisher_axial_kernel, k=k),
+                    grid,
+                    direction_cosines,
+                    memory_limit,
+                    weights,
+                    precision,
+                )
             return count(grid, direction_cosines, k)
 
     except ImportError:
-
-        def counter(grid, direction_cosines):
-            try:
-                return np.exp(
-                    k * (np.abs(np.dot(grid, direction_cosines.T)) - 1)
-                ).sum(axis=1)
-            except MemoryError:
-                result = np.zeros((grid.shape[0], 1))
-                for input_node, output_node in zip(grid, result):
-                    output_node[:] = np.exp(
-                        k
-                        * (np.abs(np.dot(input_node, direction_cosines.T)) - 1)
-                    ).sum()
+        counter = KernelCounter(
+            partial(fisher_axial_kernel, k=k), memory_limit, precision
+        )
 
     return counter
 
 
 @parallel_counter
-def RobinGirdleCounter(k):
+def RobinGirdleCounter(k, memory_limit=None, precision=None):
     try:
         from grid_functions.robin_girdle_counter import count
 
-        def counter(grid, direction_cosines):
+        def counter(grid, direction_cosines, weights=None):
+            if weights is not None:  # the compiled counters are unweighted
+                return block_count(
+                    partial(robin_girdle_kernel, k=k),
+                    grid,
+                    direction_cosines,
+                    memory_limit,
+                    weights,
+                    precision,
+                )
             return count(grid, direction_cosines, k)
 
     except ImportError:
-
-        def counter(grid, direction_cosines):
-            try:
-                return np.exp(
-                    k * (np.dot(grid, direction_cosines.T) ** 2)
-                ).sum(axis=1)
-            except MemoryError:
-                result = np.zeros((grid.shape[0], 1))
-                for input_node, output_node in zip(grid, result):
-                    output_node[:] = np.exp(
-                        k * (np.dot(input_node, direction_cosines.T) ** 2)
-                    ).sum()
+        counter = KernelCounter(
+            partial(robin_girdle_kernel, k=k), memory_limit, precision
+        )
 
     return counter
 
 
+@parallel_counter
+def KambCounter(theta, memory_limit=None, precision=None):
+    return KernelCounter(
+        partial(kamb_kernel, theta=theta), memory_limit, precision
+    )
+
+
+class SphericalIndex(object):
+    def __init__(self, direction_cosines, weights=None):
+        """\
+Answers cone range queries over axial direction cosines, so that counting
+only evaluates the data close to each node. Built as a KD-tree over the data
+and their antipodes, which requires scipy. Counts are weighted by weights,
+if given."""
+        # this is here so as to keep scipy as an optional
+        from scipy.spatial import cKDTree
+
+        self.data = np.asarray(direction_cosines)
+        self.weights = weights
+        self.n = self.data.shape[0]
+        self.tree = cKDTree(np.vstack((self.data, -self.data)))
+        self._cells = None
+
+    def neighbours(self, nodes, cos_theta):
+        """\
+Returns the node indices, data indices and absolute cosines of every pair
+inside a cone of cosine cos_theta around the nodes."""
+        from scipy.spatial import cKDTree
+
+        # a little slack on the chord so that the cosine test below decides
+        # the pairs on the boundary, exactly as the brute force counters do.
+        radius = sqrt(max(2.0 - 2.0 * cos_theta, 0.0)) * (1 + 1e-9) + 1e-12
+        pairs = cKDTree(nodes).sparse_distance_matrix(
+            self.tree, radius, output_type="ndarray"
+        )
+        node_index = pairs["i"]
+        data_index = pairs["j"] % self.n
+        cosines = np.abs(
+            np.einsum("ij,ij->i", nodes[node_index], self.data[data_index])
+        )
+        inside = cosines >= cos_theta
+        return node_index[inside], data_index[inside], cosines[inside]
+
+    def count(self, kernel, grid, cos_theta, memory_limit=None):
+        """\
+Sums kernel over the absolute cosines of the data inside a cone of cosine
+cos_theta around each node, working over blocks of nodes sized by the
+expected number of neighbours so as to respect memory_limit."""
+        memory_limit = (
+            counting_memory_limit if memory_limit is None else memory_limit
+        )
+        if cos_theta <= 0.0:  # the cone holds every axial datum
+            return block_count(
+                kernel, grid, self.data, memory_limit, self.weights
+            )
+        grid = np.asarray(grid)
+        result = np.zeros(grid.shape[0])
+        # expected neighbours of a node for uniform data, ~48 bytes each
+        expected = max(self.n * (1.0 - cos_theta), 1.0)
+        block_size = max(1, int(memory_limit // (48 * expected)))
+        for start in range(0, grid.shape[0], block_size):
+            nodes = grid[start : start + block_size]
+            node_index, data_index, cosines = self.neighbours(
+                nodes, cos_theta
+            )
+            contributions = kernel(cosines)
+            if self.weights is not None:
+                contributions = contributions * self.weights[data_index]
+            result[start : start + nodes.shape[0]] = np.bincount(
+                node_index, weights=contributions, minlength=nodes.shape[0]
+            )
+        return result
+
+    @property
+    def cells(self):
+        """\
+The data sorted into the cells of a coarse sphere_regular_grid, as a tuple
+of (cell centers, KD-tree over them, cell radius, sorted data, sorted
+weights, cell starts, cell stops)."""
+        if self._cells is None:
+            from scipy.spatial import cKDTree
+
+            centers = dcos_lines(sphere_regular_grid(index_cell_spacing))
+            tree = cKDTree(centers)
+            distance, label = tree.query(self.data)
+            order = np.argsort(label, kind="stable")
+            stops = np.cumsum(np.bincount(label, minlength=len(centers)))
+            starts = np.concatenate(([0], stops[:-1]))
+            radius = chord_angle(distance.max()) if self.n else 0.0
+            weights = np.ones(self.n) if self.weights is None else self.weights
+            self._cells = (
+                centers,
+                tree,
+                radius,
+                self.data[order],
+                weights[order],
+                starts,
+                stops,
+            )
+        return self._cells
+
+    def count_cells(
+        self, kernel, grid, cos_theta, memory_limit=None, precision=None
+    ):
+        """\
+Sums the axial kernel over the data for each node, evaluating only the data
+in cells that may hold points inside a cone of cosine cos_theta around it.
+Nodes sharing a cell are counted together, so each evaluation is still a
+matrix product, in precision (see block_count). Returns the counts and the
+total weight (number, if unweighted) of the data evaluated for each node."""
+        total = self.n if self.weights is None else self.weights.sum()
+        grid = np.asarray(grid)
+        if cos_theta <= 0.0 or self.n == 0:
+            result = block_count(
+                kernel, grid, self.data, memory_limit, self.weights, precision
+            )
+            return result, np.full(grid.shape[0], float(total))
+        centers, tree, cell_radius, data, weights, starts, stops = self.cells
+        result = np.zeros(grid.shape[0])
+        evaluated = np.zeros(grid.shape[0])
+        distance, label = tree.query(grid)
+        order = np.argsort(label, kind="stable")
+        bounds = np.flatnonzero(np.diff(label[order])) + 1
+        cone = math.acos(min(cos_theta, 1.0))
+        for members in np.split(order, bounds):
+            center = centers[label[members[0]]]
+            reach = cone + chord_angle(distance[members].max()) + cell_radius
+            if reach >= pi / 2:  # the cones around node and antipode meet
+                subset, subset_weights = data, weights
+            else:
+                chord = 2 * sin(reach / 2) * (1 + 1e-9) + 1e-12
+                cells = tree.query_ball_point(center, chord)
+                cells += tree.query_ball_point(-center, chord)
+                subset = np.concatenate(
+                    [data[starts[i] : stops[i]] for i in cells]
+                )
+                subset_weights = np.concatenate(
+                    [weights[starts[i] : stops[i]] for i in cells]
+                )
+            result[members] = block_count(
+                kernel,
+                grid[members],
+                subset,
+                memory_limit,
+                subset_weights,
+                precision,
+            )
+            evaluated[members] = subset_weights.sum()
+        return result, evaluated
+
+
+def hexagonal_ring(nodes, spacing):
+    """\
+Returns the six points around each of the nodes at an angular distance of
+spacing radians from it, 60 degrees apart."""
+    nodes = np.asarray(nodes)
+    # any direction perpendicular to each node, and a third one to both
+    helper = np.where(
+        np.abs(nodes[:, 2:3]) < 0.9, (0.0, 0.0, 1.0), (1.0, 0.0, 0.0)
+    )
+    u = np.cross(nodes, helper)
+    u /= np.linalg.norm(u, axis=1)[:, None]
+    v = np.cross(nodes, u)
+    angles = np.arange(6) * pi / 3
+    ring = (
+        np.cos(angles)[None, :, None] * u[:, None, :]
+        + np.sin(angles)[None, :, None] * v[:, None, :]
+    )
+    ring = cos(spacing) * nodes[:, None, :] + sin(spacing) * ring
+    return ring.reshape(-1, 3)
+
+
+def chord_angle(chord):
+    """Returns the angle, in radians, subtended by a unit sphere chord."""
+    return 2 * math.asin(min(chord / 2, 1.0))
+
+
+class KCrossValidation(object):
+    def __init__(
+        self,
+        direction_cosines,
+        weights=None,
+        sample=None,
+        seed=0,
+        memory_limit=None,
+    ):
+        """\
+Leave-one-out log likelihood of the axial fisher kernel density estimate
+of the data, as a function of k. The distances (1 - |cos|) from a sample of
+the data to every datum are computed once, in blocks, and kept either
+exactly or, if they would not fit in memory_limit (counting_memory_limit if
+not given), as a histogram for each sampled datum, over optimize_k_bins
+bins of the square root of the distance (about even in angle). Each
+evaluation then costs a few operations per sampled datum and bin."""
+        memory_limit = (
+            counting_memory_limit if memory_limit is None else memory_limit
+        )
+        data = np.asarray(direction_cosines, dtype=float)
+        n = data.shape[0]
+        weights = np.ones(n) if weights is None else np.asarray(weights)
+        rows = np.arange(n)
+        if sample is not None and sample < n:
+            rows = np.sort(
+                np.random.default_rng(seed).choice(n, sample, replace=False)
+            )
+        self.weights = weights[rows]
+        # the sampled datum itself is left out, but not its duplicates
+        self.self_weights = self.weights - 1.0
+        block_size = max(1, int(memory_limit // (4 * 8 * max(n, 1))))
+        self.exact = rows.size * n * 8 <= memory_limit
+        if self.exact:
+            self.distances = np.empty((rows.size, n))
+        else:
+            bins = optimize_k_bins
+            counts = np.zeros(rows.size * bins)
+            sums = np.zeros(rows.size * bins)
+        for start in range(0, rows.size, block_size):
+            block = rows[start : start + block_size]
+            diagonal = np.arange(block.size), block
+            distances = np.dot(data[block], data.T)
+            np.abs(distances, out=distances)
+            np.subtract(1.0, distances, out=distances)
+            np.maximum(distances, 0.0, out=distances)
+            if self.exact:
+                distances[diagonal] = np.inf
+                self.distances[start : start + block.size] = distances
+                continue
+            block_bins = (np.sqrt(distances) * (bins - 1)).astype(int)
+            block_bins += (np.arange(block.size) * bins)[:, None]
+            block_weights = np.repeat(weights[None, :], block.size, axis=0)
+            block_weights[diagonal] = 0.0
+            section = slice(start * bins, (start + block.size) * bins)
+            counts[section] += np.bincount(
+                block_bins.ravel(), block_weights.ravel(), block.size * bins
+            )
+            block_weights *= distances
+            sums[section] += np.bincount(
+                block_bins.ravel(), block_weights.ravel(), block.size * bins
+            )
+        if self.exact:
+            self.log_counts = np.log(weights)[None, :]
+        else:
+            # each bin is taken as all of its data at their mean distance
+            counts = counts.reshape(rows.size, bins)
+            occupied = counts > 0.0
+            counts[~occupied] = 1.0
+            self.log_counts = np.where(occupied, np.log(counts), -np.inf)
+            self.distances = np.where(
+                occupied, sums.reshape(rows.size, bins) / counts, 0.0
+            )
+
+    def __call__(self, k):
+        """\
+Returns the leave-one-out log likelihood of the sampled data for k."""
+        # log of sum(w*exp(-k*d)), shifting by the largest term as usual
+        terms = self.log_counts - k * self.distances
+        largest = np.maximum(
+            terms.max(axis=1),
+            np.log(np.maximum(self.self_weights, 1e-300)),
+        )
+        total = np.exp(terms - largest[:, None]).sum(axis=1)
+        total += self.self_weights * np.exp(-largest)
+        log_density = (
+            math.log(k)
+            - math.log(2 * pi)
+            - math.log(-math.expm1(-2 * k))
+            + largest
+            + np.log(total)
+        )
+        return np.dot(self.weights, log_density)
+
+
 class SphericalGrid(object):
     def __init__(self, *args, **kwargs):
         """Creates a spherical counting grid"""
         self.args, self.kwargs = args, kwargs
         node_spacing = self.kwargs.get("node_spacing", 2.5)
-        self.grid_nodes = sphere_regular_grid(node_spacing)
-        self.grid = dcos_lines(self.grid_nodes)
+        self.memory_limit = self.kwargs.get("counting_memory_limit", None)
+        self.precision = self.kwargs.get("counting_precision", None)
+        self.index_threshold = self.kwargs.get(
+            "spatial_index_threshold", spatial_index_threshold
+        )
+        # the node layout, see grid_layouts
+        self.layout = self.kwargs.get("grid_layout", "regular")
+        self.grid_nodes, self.grid = registered_grid(
+            node_spacing, layout=self.layout
+        )
+        self.node_spacing = node_spacing
         self.result = None
+        self.error_bound = 0.0
+        # (key, direction cosines, weights, result) of the last count made
+        # through count_incremental, see there.
+        self.counted = None
 
     def change_spacing(self, node_spacing):
-        self.grid_nodes = sphere_regular_grid(node_spacing)
-        self.grid = dcos_lines(self.grid_nodes)
+        if node_spacing == self.node_spacing:
+            return
+        self.grid_nodes, self.grid = registered_grid(
+            node_spacing, layout=self.layout
+        )
+        self.node_spacing = node_spacing
         self.result = None
 
-    def optimize_k(self, direction_cosines):
+    def optimize_k(self, data, weights=None, sample=None, seed=0):
+        """\
+Optimizes the value of k for data (a DirectionalData object or any numpy
+array-like, with the given weights), by maximizing the leave-one-out
+likelihood of Diggle and Fisher (1985). The distances from the data to the
+other data are computed once, through a KCrossValidation, for every trial
+of k, and the likelihood only sums over sample of the data (a random
+subsample of optimize_k_sample data if not given) on large datasets."""
         # this is here so as to keep scipy as an optional
         from scipy.optimize import minimize_scalar
 
-        def obj(k):
-            W = np.exp(
-                k * (np.abs(np.dot(direction_cosines, direction_cosines.T)))
-            ) * (k / (4 * math.pi * math.sinh(k + 1e-9)))
-            # W = np.power(density, k)
-            np.fill_diagonal(W, 0.0)
-            return -np.log(W.sum(axis=0)).sum()
-
-        return minimize_scalar(obj).x
+        direction_cosines, weights, n = self.counting_data(data, weights)
+        likelihood = KCrossValidation(
+            direction_cosines,
+            weights,
+            optimize_k_sample if sample is None else sample,
+            seed,
+            self.memory_limit,
+        )
+        return math.exp(
+            minimize_scalar(
+                lambda log_k: -likelihood(math.exp(log_k)),
+                bounds=optimize_k_bounds,
+                method="bounded",
+            ).x
+        )
 
-    def count_fisher(self, data, k=None):
+    def counting_data(self, data, weights=None):
         """\
-Performs data counting as in Robin and Jowett (1986). May either receive
-as input a DirectionalData object or any numpy array-like. Will guess an appropriate
-k if not given and not available from the DirectionalData options."""
+Returns the direction cosines and weights to count for data, either a
+DirectionalData object (its weighted_data) or any numpy array-like with the
+given weights, along with their total weight."""
+        if isinstance(data, DirectionalData):
+            direction_cosines, weights = data.weighted_data
+            return direction_cosines, weights, data.total_weight
+        direction_cosines = np.asarray(data)
+        if weights is None:
+            return direction_cosines, None, direction_cosines.shape[0]
+        weights = np.asarray(weights, dtype=float)
+        return direction_cosines, weights, weights.sum()
+
+    def fisher_k(self, data, k=None, n=None):
+        """\
+Returns k if given, or the counting_k option of data, or else the value
+recommended by Robin and Jowett (1986) for n data."""
         if isinstance(data, DirectionalData):
             k = k if k is not None else data.kwargs.get("counting_k", None)
-            n = data.n
-            direction_cosines = data.data
-        else:
-            direction_cosines = data
-            n = data.shape[0]
         if k is None:
             if n < 100:  # This is the Recomendation made by Robin & Jowett 86
                 k = 2 * (n + 1)
             else:
                 k = 100
-        try:  # It is bettter to beg forgiveness that ask for permittion.
-            self.result = np.exp(
-                k * (np.abs(np.dot(self.grid, direction_cosines.T)) - 1)
-            ).sum(axis=1)
-
-            return self.result
-        except MemoryError:
-            result = np.zeros((self.grid.shape[0], 1))
-            for input_node, output_node in zip(self.grid, result):
-                output_node[:] = np.exp(
-                    k * (np.abs(np.dot(input_node, direction_cosines.T)) - 1)
-                ).sum()
-        self.result = result
-        return result
+        return k
 
-    def count_kamb(self, data, theta=None):
+    def kamb_theta(self, data, theta=None, n=None):
         """\
-Performs data counting as in Robin and Jowett (1986) based on Kamb (1956), May either receive
-as input a DirectionalData object or any numpy array-like. Will guess an appropriate
-counting angle theta if not given and not available from the DirectionalData options."""
+Returns the cosine of the counting angle theta if given, or of the
+counting_theta option of data, or else the one recommended by Robin and
+Jowett (1986) for n data."""
         if isinstance(data, DirectionalData):
             theta = (
                 theta
                 if theta is not None
                 else data.kwargs.get("counting_theta", None)
             )
-            n = data.n
-            direction_cosines = data.data
-        else:
-            direction_cosines = data
-            n = data.shape[0]
         if theta is None:
-            theta = (n - 1.0) / (n + 1.0)
+            return (n - 1.0) / (n + 1.0)
+        return math.cos(math.radians(theta))
+
+    def count_fisher(self, data, k=None, weights=None):
+        """\
+Performs data counting as in Robin and Jowett (1986). May either receive
+as input a DirectionalData object or any numpy array-like. Will guess an appropriate
+k if not given and not available from the DirectionalData options."""
+        direction_cosines, weights, n = self.counting_data(data, weights)
+        k = self.fisher_k(data, k, n)
+        self.result = self.count_incremental(
+            ("fisher", k),
+            FisherCounterAxial(k, self.memory_limit, self.precision),
+            direction_cosines,
+            weights,
+        )
+        return self.result
+
+    def count_fisher_truncated(
+        self, data, k=None, tolerance=None, weights=None
+    ):
+        """\
+Performs data counting as count_fisher, but leaves out the data that are
+too far from each node to add more than tolerance to its count. For the
+large k usually applied to large datasets this only evaluates the data
+inside a narrow cone around each node. The largest possible absolute error
+of the counts this causes is stored as error_bound. Counts exactly, with no
+error, if scipy is missing or the dataset is small."""
+        direction_cosines, weights, n = self.counting_data(data, weights)
+        k = self.fisher_k(data, k, n)
+        if isinstance(data, DirectionalData):
+            tolerance = (
+                tolerance
+                if tolerance is not None
+                else data.kwargs.get("counting_tolerance", None)
+            )
+        tolerance = fisher_tolerance if tolerance is None else tolerance
+        # exp(k*(|cos|-1)) < tolerance for every datum outside this cone
+        cutoff = 1.0 + math.log(tolerance) / k
+        index = self.spatial_index(data, cutoff, max_cone=1.0, weights=weights)
+        if index is None:
+            self.error_bound = 0.0
+            return self.count_fisher(direction_cosines, k, weights)
+        self.result, evaluated = index.count_cells(
+            partial(fisher_axial_kernel, k=k),
+            self.grid,
+            cutoff,
+            self.memory_limit,
+            self.precision,
+        )
+        self.error_bound = float((n - evaluated).max()) * tolerance
+        return self.result
+
+    def count_kamb(self, data, theta=None, weights=None):
+        """\
+Performs data counting as in Robin and Jowett (1986) based on Kamb (1956), May either receive
+as input a DirectionalData object or any numpy array-like. Will guess an appropriate
+counting angle theta if not given and not available from the DirectionalData options."""
+        direction_cosines, weights, n = self.counting_data(data, weights)
+        theta = self.kamb_theta(data, theta, n)
+        counter = KambCounter(theta, self.memory_limit, self.precision)
+
+        def count_all(grid, direction_cosines, weights):
+            index = self.spatial_index(data, theta, weights=weights)
+            if index is None:
+                return counter(grid, direction_cosines, weights)
+            return index.count(
+                partial(kamb_kernel, theta=theta),
+                grid,
+                theta,
+                self.memory_limit,
+            )
+
+        self.result = self.count_incremental(
+            ("kamb", theta), counter, direction_cosines, weights, count_all
+        )
+        return self.result
+
+    def count_adaptive(
+        self,
+        data,
+        method="fisher",
+        parameter=None,
+        levels=None,
+        depth=None,
+        threshold=None,
+        weights=None,
+    ):
+        """\
+Counts data, by the fisher or kamb method (with parameter as its k or
+theta), over an adaptive grid: starting from this grid, nodes are refined,
+up to depth times (adaptive_grid_depth if not given), by counting on six
+new nodes around them at half the spacing. Nodes are refined where the
+counts of the nodes close to them differ by more than threshold (relative to
+the largest count, adaptive_grid_threshold if not given) or straddle one of
+the contour levels, given either as a sequence or as a number of levels
+evenly spaced between the smallest and the largest count. Returns the
+direction cosines of the nodes, as an unstructured set ready for
+triangulation, and their counts."""
+        depth = adaptive_grid_depth if depth is None else depth
+        threshold = adaptive_grid_threshold if threshold is None else threshold
+        direction_cosines, weights, n = self.counting_data(data, weights)
+        if method == "fisher":
+            counts = self.count_fisher(data, parameter, weights)
+            counter = FisherCounterAxial(
+                self.fisher_k(data, parameter, n),
+                self.memory_limit,
+                self.precision,
+            )
         else:
-            theta = math.cos(math.radians(theta))
-        try:
-            self.result = np.where(
-                np.abs(np.dot(self.grid, direction_cosines.T)) >= theta, 1, 0
-            ).sum(axis=1)
-            return self.result
-        except MemoryError:
-            result = np.zeros((self.grid.shape[0], 1))
-            for input_node, output_node in zip(self.grid, result):
-                output_node[:] = np.where(
-                    np.abs(np.dot(input_node, direction_cosines.T)) >= theta,
-                    1,
-                    0,
-                ).sum()
-        self.result = result
+            counts = self.count_kamb(data, parameter, weights)
+            counter = KambCounter(
+                self.kamb_theta(data, parameter, n),
+                self.memory_limit,
+                self.precision,
+            )
+        if levels is not None and np.ndim(levels) == 0:
+            levels = np.linspace(counts.min(), counts.max(), levels)
+        scale = threshold * (counts.max() or 1.0)
+        nodes = self.grid
+        candidates = np.arange(nodes.shape[0])
+        spacing = math.radians(self.node_spacing)
+        memory_limit = (
+            counting_memory_limit
+            if self.memory_limit is None
+            else self.memory_limit
+        )
+        for _ in range(depth):
+            # nodes closer than this are the neighbours of a node
+            neighbourhood = math.cos(1.5 * spacing)
+            block_size = max(
+                1, int(memory_limit // (3 * 8 * max(nodes.shape[0], 1)))
+            )
+            refine = []
+            for start in range(0, candidates.size, block_size):
+                block = candidates[start : start + block_size]
+                near = np.dot(nodes[block], nodes.T) >= neighbourhood
+                highest = np.where(near, counts, -np.inf).max(axis=1)
+                lowest = np.where(near, counts, np.inf).min(axis=1)
+                steep = highest - lowest > scale
+                if levels is not None:
+                    steep |= np.searchsorted(
+                        levels, lowest, side="right"
+                    ) != np.searchsorted(levels, highest, side="right")
+                refine.append(block[steep])
+            refine = np.concatenate(refine)
+            if refine.size == 0:
+                break
+            spacing /= 2.0
+            children = hexagonal_ring(nodes[refine], spacing)
+            # new nodes must be at least half the spacing away from the older
+            # nodes and from the new nodes before them.
+            separation = math.cos(spacing / 2)
+            kept = np.ones(children.shape[0], dtype=bool)
+            for start in range(0, children.shape[0], block_size):
+                block = np.arange(start, min(start + block_size, kept.size))
+                close = np.dot(children[block], children.T) >= separation
+                close &= np.arange(kept.size)[None, :] < block[:, None]
+                kept[block] = ~close.any(axis=1)
+            children = children[kept]
+            children = children[
+                block_count(
+                    lambda cosines: cosines >= separation,
+                    children,
+                    nodes,
+                    memory_limit,
+                )
+                == 0
+            ]
+            if children.shape[0] == 0:
+                break
+            candidates = np.arange(
+                nodes.shape[0], nodes.shape[0] + children.shape[0]
+            )
+            nodes = np.concatenate((nodes, children))
+            counts = np.concatenate(
+                (counts, counter(children, direction_cosines, weights))
+            )
+        return nodes, counts
+
+    def check_precision(
+        self, data, method="fisher", parameter=None, precision=np.float32
+    ):
+        """\
+Counts data by the fisher or kamb method (with parameter as its k or
+theta) both in double and in precision, returning their largest difference
+relative to the largest count. Single precision cosines are off by up to
+about 6e-8, so fisher counts differ by about k times that, relatively, and
+kamb counts only by the data that close to the counting circle."""
+        direction_cosines, weights, n = self.counting_data(data)
+        if method == "fisher":
+            counter_factory = FisherCounterAxial
+            parameter = self.fisher_k(data, parameter, n)
+        else:
+            counter_factory = KambCounter
+            parameter = self.kamb_theta(data, parameter, n)
+        double = counter_factory(parameter, self.memory_limit, np.float64)(
+            self.grid, direction_cosines, weights
+        )
+        result = counter_factory(parameter, self.memory_limit, precision)(
+            self.grid, direction_cosines, weights
+        )
+        return np.abs(result - double).max() / (np.abs(double).max() or 1.0)
+
+    def count_incremental(
+        self, key, counter, direction_cosines, weights=None, count_all=None
+    ):
+        """\
+Counts the data with counter, which must sum the contribution of each
+datum, or with count_all, if given, when the data has to be counted in full.
+If the last data counted with the same key (the counting method and its
+parameters) differs from this data by fewer rows than it holds, only the
+rows added or removed since are counted, and their counts added to or
+subtracted from the previous ones."""
+        count_all = counter if count_all is None else count_all
+        key = key + (self.node_spacing,)
+        if self.counted is not None and self.counted[0] == key:
+            _, previous_data, previous_weights, previous_result = self.counted
+            rows = np.concatenate((previous_data, direction_cosines))
+            # the rows that changed end up with a non zero net weight
+            changes = np.concatenate(
+                (
+                    -np.ones(previous_data.shape[0])
+                    if previous_weights is None
+                    else -previous_weights,
+                    np.ones(direction_cosines.shape[0])
+                    if weights is None
+                    else weights,
+                )
+            )
+            rows, changes = aggregate_directions(rows, changes)
+            changed = changes != 0.0
+            if changed.sum() < direction_cosines.shape[0]:
+                result = previous_result + (
+                    counter(self.grid, rows[changed], changes[changed])
+                    if changed.any()
+                    else 0.0
+                )
+                self.counted = key, direction_cosines, weights, result
+                return result
+        result = count_all(self.grid, direction_cosines, weights)
+        self.counted = key, direction_cosines, weights, result
         return result
 
+    def spatial_index(self, data, cos_theta, max_cone=None, weights=None):
+        """\
+Returns a SphericalIndex over data if it holds enough distinct directions
+and the counting cone (of cosine cos_theta) is narrower than max_cone
+(spatial_index_max_cone if not given) for cone queries to beat counting
+over every grid x data pair, or None otherwise (or if scipy is missing)."""
+        max_cone = spatial_index_max_cone if max_cone is None else max_cone
+        direction_cosines, weights, n = self.counting_data(data, weights)
+        if (
+            direction_cosines.shape[0] < self.index_threshold
+            or 1.0 - cos_theta > max_cone
+        ):
+            return None
+        try:
+            if isinstance(data, DirectionalData):
+                return data.spatial_index
+            return SphericalIndex(direction_cosines, weights)
+        except ImportError:
+            return None
+
     def count(self, data, method=None):
         """\
 If method isn't given, search data for it. If method is a function, execute it with the counting grid
 and the data object as parameters, or search SphericalGrid for it, in case it is a string."""
         if isinstance(data, DirectionalData):
             method = method or data.kwargs.get("counting_method", None)
-            direction_cosines = data.data
-        else:
-            direction_cosines = data
+        direction_cosines, weights, n = self.counting_data(data)
         if not method is None:
             if isinstance(method, str):
-                return self.__getattribute__(method)(direction_cosines)
+                return self.__getattribute__(method)(
+                    direction_cosines, weights=weights
+                )
+            elif weights is not None:
+                return method(self.grid, direction_cosines, weights)
             else:
                 return method(self.grid, direction_cosines)
 
@@ -1054,6 +3510,7 @@ and the data object as parameters, or search SphericalGrid for it, in case it is
 class CircularGrid(object):
     def __init__(self, spacing=1.0, offset=0.0, **kwargs):
         self.spacing = spacing
+        self.precision = kwargs.get("counting_precision", None)
         self.grid = self.build_grid(spacing, offset)
 
     def build_grid(self, spacing, offset=0.0, from_=0.0, to_=2 * pi):
@@ -1072,7 +3529,12 @@ class CircularGrid(object):
         return np.array((np.sin(theta_range), np.cos(theta_range))).T
 
     def cdis(self, data, nodes=None, axial=False):
+        precision = (
+            counting_precision if self.precision is None else self.precision
+        )
         nodes = self.grid if nodes is None else nodes
+        nodes = np.asarray(nodes, dtype=precision)
+        data = np.asarray(data, dtype=precision)
         d = np.clip(
             np.dot(nodes, np.transpose(data)) / np.linalg.norm(data, axis=1),
             -1,
@@ -1082,6 +3544,131 @@ class CircularGrid(object):
             d = np.abs(d)
         return d
 
+    @staticmethod
+    def lattice(nodes):
+        """\
+Returns the azimuth of the first node and the spacing between nodes if they
+are evenly spaced, as built by build_grid, or None otherwise."""
+        nodes = np.asarray(nodes, dtype=float)
+        if nodes.shape[0] < 2:
+            return None
+        azimuths = np.arctan2(nodes[:, 0], nodes[:, 1])
+        steps = np.diff(azimuths) % (2 * pi)
+        spacing = steps.mean()
+        if spacing <= 0.0 or np.abs(steps - spacing).max() > 1e-9:
+            return None
+        return azimuths[0], spacing
+
+    @staticmethod
+    def divides_circle(lattice):
+        # whether the spacing of the lattice divides the circle exactly, so
+        # that its nodes repeat with each turn
+        turns = 2 * pi / lattice[1]
+        return abs(turns - round(turns)) <= 1e-6
+
+    def count_histogram(
+        self, data, aperture, lattice, bins, axial=False, data_weight=None
+    ):
+        """\
+Counts the data on petals that do not overlap, given their half aperture and
+the lattice of their nodes, by binning the azimuth of each datum on the
+nearest node instead of comparing it to every node. The spacing of the
+lattice must divide the circle exactly (see divides_circle)."""
+        start, spacing = lattice
+        azimuths, weights, total = self.azimuths(data, axial, data_weight)
+        offsets = (azimuths - start) % (2 * pi)
+        index = np.rint(offsets / spacing)
+        # past the last node, data may still be on the petal of the first one
+        wrap = index >= bins
+        index[wrap] = 0.0
+        offsets[wrap] -= 2 * pi
+        # the tolerance keeps data on the edge of touching petals, which the
+        # rounding above assigns to a single one of them
+        inside = np.abs(offsets - index * spacing) <= aperture + 1e-9
+        return (
+            np.bincount(
+                index[inside].astype(int), weights[inside], minlength=bins
+            )[:, None]
+            / total
+        )
+
+    def count_lattice(
+        self,
+        data,
+        kernel,
+        aperture,
+        lattice,
+        bins,
+        axial=False,
+        data_weight=None,
+        resolution=None,
+    ):
+        """\
+Counts the data on evenly spaced nodes around the whole circle with a kernel
+of the angular distance, up to the given half aperture, by convolving it with
+a histogram of the azimuths on a lattice finer than the nodes. Each datum is
+split between its two closest lattice points, so that the cost depends on
+the lattice size rather than on the number of data. Returns None if the
+nodes don't divide the circle evenly.
+As the data are spread over the lattice, those within a lattice step of the
+edge of the aperture are only partly counted, so each petal may be off by a
+few data: at the default resolution, about 2 to 10 data (up to 1e-3 of the
+largest petal at 10000 data, 3e-4 at 50000, 6e-5 at 1000000). A finer
+resolution reduces this, at the cost of a larger lattice."""
+        if not self.divides_circle(lattice):
+            return None
+        start, spacing = lattice
+        turns = 2 * pi / spacing
+        resolution = (
+            rose_lattice_resolution if resolution is None else resolution
+        )
+        subdivisions = max(1, int(math.ceil(spacing / radians(resolution))))
+        step = spacing / subdivisions
+        size = int(round(turns)) * subdivisions
+        azimuths, weights, total = self.azimuths(data, axial, data_weight)
+        position = ((azimuths - start) % (2 * pi)) / step
+        lower = np.floor(position)
+        fraction = position - lower
+        lower = lower.astype(int) % size
+        histogram = np.bincount(
+            lower, weights * (1.0 - fraction), minlength=size
+        ) + np.bincount((lower + 1) % size, weights * fraction, minlength=size)
+        reach = int(math.floor(aperture / step)) + 1
+        offsets = np.arange(-reach, reach + 1)
+        # as each datum is spread over the lattice, the points near the edge
+        # of the aperture only count the share of it that falls inside
+        edge = np.clip(aperture / step - np.abs(offsets), -1.0, 1.0)
+        coverage = np.where(
+            edge > 0.0, 1.0 - (1.0 - edge) ** 2 / 2, (1.0 + edge) ** 2 / 2
+        )
+        distance = np.minimum(np.abs(offsets) * step, aperture)
+        window = kernel(distance) * coverage
+        index = (
+            np.arange(bins)[:, None] * subdivisions + offsets[None, :]
+        ) % size
+        return np.dot(histogram[index], window)[:, None] / total
+
+    def azimuths(self, data, axial=False, data_weight=None):
+        """\
+Returns the azimuths of the valid (non null) data, in radians, with their
+weights, and the total weight of the data. Axial data get their antipodes
+as well."""
+        data = np.asarray(data, dtype=float)
+        n = data.shape[0]
+        data_weight = (
+            np.ones(n)
+            if data_weight is None
+            else np.asarray(data_weight, dtype=float)
+        )
+        # as with the cosines, null or undefined directions count nowhere
+        valid = np.isfinite(data).all(axis=1) & (data != 0.0).any(axis=1)
+        azimuths = np.arctan2(data[valid, 0], data[valid, 1])
+        weights = data_weight[valid]
+        if axial:
+            azimuths = np.concatenate((azimuths, azimuths + pi))
+            weights = np.concatenate((weights, weights))
+        return azimuths, weights, data_weight.sum()
+
     def count(
         self,
         data,
@@ -1111,10 +3698,32 @@ class CircularGrid(object):
         c = cos(aperture)
         n = data.shape[0]
         data_weight = np.ones(n) if data_weight is None else data_weight
+        lattice = self.lattice(nodes)
+        if (
+            lattice is not None
+            and 2.0 * aperture <= lattice[1] + 1e-9
+            and self.divides_circle(lattice)
+        ):
+            return self.count_histogram(
+                data, aperture, lattice, len(nodes), axial, data_weight
+            )
+        if lattice is not None and n >= rose_lattice_threshold:
+            result = self.count_lattice(
+                data,
+                np.ones_like,
+                aperture,
+                lattice,
+                len(nodes),
+                axial,
+                data_weight,
+            )
+            if result is not None:
+                return result
+        # summed in double, whatever the precision of the cosines
         return (
-            np.where(
-                self.cdis(data, nodes, axial=axial) >= c, data_weight, 0.0
-            ).sum(axis=1)[:, None]
+            np.dot(self.cdis(data, nodes, axial=axial) >= c, data_weight)[
+                :, None
+            ]
             / data_weight.sum()
         )
 
@@ -1136,14 +3745,12 @@ class CircularGrid(object):
                 if spacing is None
                 else self.build_grid(spacing, offset)
             )
-        d = self.cdis(data, nodes, axial=axial)
+        lattice = self.lattice(nodes)
         aperture = (
             radians(aperture) / 2.0
             if aperture is not None
             else radians(self.spacing) / 2.0
         )
-        c = cos(aperture)
-        theta = np.arccos(d) * pi / aperture
         data_weight = (
             np.ones(data.shape[0]) if data_weight is None else data_weight
         )
@@ -1154,10 +3761,24 @@ class CircularGrid(object):
                 weight, np.arange(0.0, aperture, radians(spacing))
             ).sum()
         )
+        if lattice is not None and data.shape[0] >= rose_lattice_threshold:
+            result = self.count_lattice(
+                data,
+                lambda distance: np.power(weight, distance * pi / aperture),
+                aperture,
+                lattice,
+                len(nodes),
+                axial,
+                data_weight,
+            )
+            if result is not None:
+                return result * upscale
+        d = self.cdis(data, nodes, axial=axial)
+        c = cos(aperture)
+        theta = np.arccos(d) * pi / aperture
+        weighted = np.where(d >= c, np.power(weight, theta), 0.0)
         return (
-            (np.where(d >= c, data_weight, 0) * np.power(weight, theta)).sum(
-                axis=1
-            )[:, None]
+            np.dot(weighted, data_weight)[:, None]
             * upscale
             / data_weight.sum()
         )
@@ -37,7 +37,7 @@ _translate = QtCore.QCoreApplication.translate
 
 import openstereo.os_auttitude as autti
 import auttitude as au
-from openstereo.io import get_data, ImportDialog, Importer
+from openstereo.io import get_data, load_data, ImportDialog, Importer
 from openstereo.data_models import (
     AttitudeData,
     CircularData,
@@ -93,6 +93,8 @@ print(sys.version)
 __version__ = "2.0b"
 
 os_qsettings = QtCore.QSettings("OpenStereo", "OpenStereo")
+# loaded data are cached unless turned off in the settings menu
+autti.cache_enabled = os_qsettings.value("cacheLoadedData", True, type=bool)
 
 
 def memory_usage_psutil():
@@ -421,6 +423,17 @@ class Main(QtWidgets.QMainWindow, Ui_MainWindow):
         )
         self.recent_projects_separator.setVisible(False)
 
+        self.actionCache_Loaded_Data = QtWidgets.QAction(
+            _translate("main", "Cache Loaded Data"),
+            self,
+            checkable=True,
+            checked=autti.cache_enabled,
+            triggered=self.set_cache_mode,
+        )
+        self.menuSettings.insertAction(
+            self.actionSettings, self.actionCache_Loaded_Data
+        )
+
         self.actionAbout.triggered.connect(self.show_about)
         self.actionDocumentation.triggered.connect(self.show_documentation)
         self.actionTutorial.triggered.connect(self.show_tutorial)
@@ -672,7 +685,7 @@ class Main(QtWidgets.QMainWindow, Ui_MainWindow):
                 importer.comment_marker = comment
             importer.longitude, importer.colatitude = plane_columns
             planes_import_data = importer.import_data()
-            planes_data_reader = list(importer.get_data())
+            planes_data_reader = importer.get_data()
             planes_data_name = "(P) {}".format(path.basename(fname))
             if len(line_columns) == 2:
                 importer.longitude, importer.colatitude = line_columns
@@ -687,7 +700,7 @@ class Main(QtWidgets.QMainWindow, Ui_MainWindow):
 
             importer.direction = False
             lines_import_data = importer.import_data()
-            lines_data_reader = list(importer.get_data())
+            lines_data_reader = importer.get_data()
             lines_data_name = "(L) {}".format(path.basename(fname))
 
             planes_item = self.import_data(
@@ -1396,6 +1409,10 @@ class Main(QtWidgets.QMainWindow, Ui_MainWindow):
             self.projection_plot.drag_rotate_mode = False
             self.actionRotate_on_Drag.setChecked(False)
 
+    def set_cache_mode(self, checked):
+        autti.cache_enabled = checked
+        os_qsettings.setValue("cacheLoadedData", checked)
+
     def new_project(self):
         self.remove_all()
         self.clear_plot()
@@ -1735,8 +1752,11 @@ class Main(QtWidgets.QMainWindow, Ui_MainWindow):
                 utf8_reader(ozf.open(item_settings_name))
             )
             data_type = list(item_settings.keys())[0]
-            if item_file is not None:
+            if item_file is not None and packed:
+                # extracted anew each time, so not worth caching
                 item_data = get_data(item_file, data["kwargs"])
+            elif item_file is not None:
+                item_data = load_data(item_file, data["kwargs"])
             else:
                 item_data = None
             if data["kwargs"] is not None:
@@ -273,6 +273,39 @@ def extents_from_center(cx, cy, ex, ey, nx, ny, w, h):
     return (left, right, bottom, top)
 
 
+def resolve_senses(planes, lines, senses):
+    """\
+Orients fault striae by their sense of movement, as resolve_sense does for
+one fault, with arrays of planes, lines and sense notes. Returns the
+oriented lines, and whether each has a defined sense."""
+    planes, lines = np.asarray(planes), np.asarray(lines)
+    planes = np.where(planes[:, -1:] > 0, -planes, planes)
+    # the first letter of each distinct note, as they mostly repeat
+    distinct, index = np.unique(
+        np.array([str(sense) for sense in senses], dtype=object),
+        return_inverse=True,
+    )
+    codes = np.array([sense.lower()[:1] for sense in distinct], dtype=object)
+    codes = codes[index.ravel()]
+    undefined = np.isin(codes, ("u", "f", "0", "5", "?"))
+    inverse = np.isin(codes, ("i", "1", "+"))
+    dextral = np.isin(codes, ("d", "3"))
+    sinistral = np.isin(codes, ("s", "4"))
+    direction = np.stack(
+        (planes[:, 1], -planes[:, 0], np.zeros(len(planes))), axis=1
+    )
+    vertical = np.abs(planes[:, 2]) == 1.0
+    direction[vertical] = (1.0, 0.0, 0.0)
+    direction /= np.linalg.norm(direction, axis=1)[:, None]
+    line_sense = np.einsum("ij,ij->i", direction, lines)
+    flip = (
+        inverse
+        | (dextral & (line_sense <= 0))
+        | (sinistral & (line_sense >= 0))
+    )
+    return np.where(flip[:, None], -lines, lines), ~undefined
+
+
 # TODO: send this upstream to autti
 def resolve_sense(plane, line, sense):
     if plane[-1] > 0:
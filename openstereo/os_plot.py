@@ -57,6 +57,9 @@ import auttitude as au
 sqrt3_2 = sqrt(3.0) / 2.0
 sqrt3 = sqrt(3.0)
 
+# largest angle, in degrees, between the vertices of the arc of a petal.
+petal_arc_resolution = 0.5
+
 
 class NavigationToolbar(NavigationToolbar2QT):
     # only display the buttons we need
@@ -977,37 +980,26 @@ class RosePlot(PlotPanel):
         self.plotaxes.add_line(lin)
 
     def plot_rose(self, nodes, radii, rose_settings):
-        patches = []
-        n = nodes.shape[0]
-        # self.plotaxes.scatter(*nodes.T, c=np.arange(n))
-
-        mid_cn = (nodes[0] + nodes[1]) / 2.0
-        theta1 = degrees(atan2(mid_cn[1], mid_cn[0]))
-        m = degrees(atan2(nodes[0, 1], nodes[0, 0]))
-        self.plotaxes.add_patch(
-            Wedge((0, 0), radii[0], theta1, 2 * m - theta1, **rose_settings)
+        radii = np.ravel(radii)
+        angles = np.degrees(np.arctan2(nodes[:, 1], nodes[:, 0]))
+        middle = nodes[:-1] + nodes[1:]
+        middle = np.degrees(np.arctan2(middle[:, 1], middle[:, 0]))
+        # each petal goes from its middle point with the next node to the one
+        # with the previous node, mirrored around the node at either end
+        theta1 = np.append(middle, 2 * angles[-1] - middle[-1])
+        theta2 = np.insert(middle, 0, 2 * angles[0] - middle[0])
+        span = (theta2 - theta1) % 360.0
+        steps = max(2, int(math.ceil(span.max() / petal_arc_resolution)))
+        theta = np.radians(
+            theta1[:, None] + span[:, None] * np.linspace(0.0, 1.0, steps)
         )
-
-        for i in range(1, n - 1):
-            pn, cn, nn = (
-                nodes[i - 1],
-                nodes[i],
-                nodes[(i + 1)],
-            )  # this is wrong...
-            mid_pc = (pn + cn) / 2.0
-            mid_cn = (cn + nn) / 2.0
-            theta1 = degrees(atan2(mid_pc[1], mid_pc[0]))
-            theta2 = degrees(atan2(mid_cn[1], mid_cn[0]))
-            radius = radii[i]
-            self.plotaxes.add_patch(
-                Wedge((0, 0), radius, theta2, theta1, **rose_settings)
-            )
-        mid_pc = (nodes[-2] + nodes[-1]) / 2.0
-        theta1 = degrees(atan2(mid_pc[1], mid_pc[0]))
-        m = degrees(atan2(nodes[-1, 1], nodes[-1, 0]))
-        self.plotaxes.add_patch(
-            Wedge((0, 0), radii[-1], 2 * m - theta1, theta1, **rose_settings)
+        arcs = radii[:, None, None] * np.stack(
+            (np.cos(theta), np.sin(theta)), axis=-1
         )
+        petals = np.concatenate(
+            (np.zeros((arcs.shape[0], 1, 2)), arcs), axis=1
+        )
+        self.plotaxes.add_collection(PolyCollection(petals, **rose_settings))
 
     def plot_kite(self, nodes, radii, full_circle, kite_settings):
         xy = (
@@ -1019,15 +1011,10 @@ class RosePlot(PlotPanel):
         self.plotaxes.add_patch(polygon)
 
     def plot_lines(self, nodes, radii, mean_deviation, line_settings):
-        patches = []
-        mean = radii.mean()
-        for node, radius in zip(nodes, radii):
-            patches.append(
-                (mean * node, radius * node)
-                if mean_deviation
-                else ((0.0, 0.0), radius * node)
-            )
-        self.plotaxes.add_collection(LineCollection(patches, **line_settings))
+        radii = np.reshape(radii, (-1, 1))
+        base = radii.mean() * nodes if mean_deviation else 0.0 * nodes
+        segments = np.stack((base, radii * nodes), axis=1)
+        self.plotaxes.add_collection(LineCollection(segments, **line_settings))
 
 
 class ClassificationPlot(PlotPanel):
@@ -588,6 +588,9 @@ class Ui_Dialog(object):
         self.prop_contour_check_digglefisher.setObjectName("prop_contour_check_digglefisher")
         self.verticalLayout_15.addWidget(self.prop_contour_check_digglefisher)
         self.verticalLayout_14.addWidget(self.groupBox_15)
+        self.prop_contour_check_adaptive = QtWidgets.QCheckBox(self.groupBox_14)
+        self.prop_contour_check_adaptive.setObjectName("prop_contour_check_adaptive")
+        self.verticalLayout_14.addWidget(self.prop_contour_check_adaptive)
         self.verticalLayout_10.addWidget(self.groupBox_14)
         spacerItem5 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         self.verticalLayout_10.addItem(spacerItem5)
@@ -1057,7 +1060,8 @@ class Ui_Dialog(object):
         Dialog.setTabOrder(self.prop_contour_calc_scangle, self.prop_contour_check_autocount)
         Dialog.setTabOrder(self.prop_contour_check_autocount, self.prop_contour_check_robinjowett)
         Dialog.setTabOrder(self.prop_contour_check_robinjowett, self.prop_contour_check_digglefisher)
-        Dialog.setTabOrder(self.prop_contour_check_digglefisher, self.prop_rose_check_standard)
+        Dialog.setTabOrder(self.prop_contour_check_digglefisher, self.prop_contour_check_adaptive)
+        Dialog.setTabOrder(self.prop_contour_check_adaptive, self.prop_rose_check_standard)
         Dialog.setTabOrder(self.prop_rose_check_standard, self.prop_rose_binwidth)
         Dialog.setTabOrder(self.prop_rose_binwidth, self.prop_rose_offset)
         Dialog.setTabOrder(self.prop_rose_offset, self.prop_rose_check_continuous)
@@ -1346,6 +1350,7 @@ class Ui_Dialog(object):
         self.groupBox_15.setTitle(_translate("Dialog", "Estimation Method"))
         self.prop_contour_check_robinjowett.setText(_translate("Dialog", "Robin && Jowett 1986"))
         self.prop_contour_check_digglefisher.setText(_translate("Dialog", "Diggle && Fisher 1985"))
+        self.prop_contour_check_adaptive.setText(_translate("Dialog", "Refine grid around density peaks"))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), _translate("Dialog", "Contours"))
         self.groupBox_16.setTitle(_translate("Dialog", "Counting Method"))
         self.prop_rose_check_standard.setText(_translate("Dialog", "Standard"))
@@ -2,6 +2,8 @@ import re
 
 from PyQt5 import QtWidgets, QtGui
 
+from openstereo.os_auttitude import ColumnTable
+
 props_re = re.compile("([^_]+)_(color_)?(.+)_([^_]+)")
 
 
@@ -190,14 +192,17 @@ def set_selected_item(table, i, j):
 
 def populate_item_table(item):  # TODO: keep selection
     data = item.auttitude_data.input_data
+    if not isinstance(data, ColumnTable):
+        data = ColumnTable.from_rows(data)
     table = item.item_table_ui.data_table
     clear_table(table)
     m = len(data)
-    n = len(data[0])
+    n = data.width
     table.setRowCount(m + 10)
     table.setColumnCount(n)
     if item.kwargs["data_headers"] is not None:
         table.setHorizontalHeaderLabels(item.kwargs["data_headers"])
     for i in range(m):
         for j in range(n):
-            table.setItem(i, j, QtWidgets.QTableWidgetItem(str(data[i][j])))
+            # the cell as read, rather than its value as a float
+            table.setItem(i, j, QtWidgets.QTableWidgetItem(data.cell(i, j)))